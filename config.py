@@ -18,6 +18,8 @@ class Config:
     POSTGRES_DB = os.getenv('POSTGRES_DB', 'postgres')
     POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
     POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', '')
+    POSTGRES_POOL_MIN = int(os.getenv('POSTGRES_POOL_MIN', 1))
+    POSTGRES_POOL_MAX = int(os.getenv('POSTGRES_POOL_MAX', 16))
 
     # MongoDB Configuration
     MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
@@ -0,0 +1,155 @@
+"""
+Fake Data Generators
+Core customers, products and orders shared by seed_fake_data.py (minimal
+columns) and seed_fake_data_expanded.py (expanded columns)
+"""
+import string
+from datetime import date, datetime
+from faker import Faker
+import numpy as np
+import pandas as pd
+
+fake = Faker()
+Faker.seed(42)  # For reproducibility
+rng = np.random.default_rng(42)
+
+COLUMN_SETS = ('minimal', 'expanded')
+
+_LETTERS = np.array(list(string.ascii_letters))
+_DIGITS = np.array(list(string.digits))
+
+
+def reseed(seed):
+    """
+    Reseed Faker and rng in place, so modules that imported them see the new
+    stream, and forget values already handed out by fake.unique
+    """
+    Faker.seed(seed)
+    fake.unique.clear()
+    rng.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+
+
+def bothify(text, n):
+    """
+    n strings like fake.bothify(text): each '?' becomes a random letter and
+    each '#' a random digit. Drawn from rng a column at a time, then the
+    (n, len(text)) character grid is reinterpreted as n strings with no
+    per-row formatting
+    """
+    chars = np.empty((n, len(text)), dtype='U1')
+    for i, c in enumerate(text):
+        if c == '?':
+            chars[:, i] = rng.choice(_LETTERS, size=n)
+        elif c == '#':
+            chars[:, i] = rng.choice(_DIGITS, size=n)
+        else:
+            chars[:, i] = c
+    return chars.view(f'U{len(text)}').ravel().tolist()
+
+
+def random_timestamps(start_days, end_days, n):
+    """
+    n timestamps, to the second, drawn uniformly between start_days and
+    end_days from now; fake.date_time_between as a single rng draw
+    """
+    now = np.datetime64(datetime.now(), 's')
+    seconds = rng.integers(start_days * 86400, end_days * 86400, size=n, endpoint=True)
+    return now + seconds.astype('timedelta64[s]')
+
+
+def random_dates(start_days, end_days, n):
+    """n dates drawn uniformly between start_days and end_days from today"""
+    today = np.datetime64(date.today(), 'D')
+    days = rng.integers(start_days, end_days, size=n, endpoint=True)
+    return today + days.astype('timedelta64[D]')
+
+
+def _check_columns(columns):
+    if columns not in COLUMN_SETS:
+        raise ValueError(f"columns must be one of {COLUMN_SETS}, got {columns!r}")
+
+
+def generate_customers(n=100, columns='minimal'):
+    """Generate fake customer data; 'expanded' adds a segment column"""
+    _check_columns(columns)
+    customers = pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'email': [fake.unique.email() for _ in range(n)],
+        'name': [fake.name() for _ in range(n)],
+        'created_at': random_timestamps(-730, 0, n),
+        'country': [fake.country_code() for _ in range(n)],
+        'city': [fake.city() for _ in range(n)],
+        'phone': [fake.phone_number() for _ in range(n)]
+    })
+    if columns == 'expanded':
+        segments = ['VIP', 'Regular', 'New', 'At-Risk']
+        customers['segment'] = pd.Categorical(rng.choice(segments, size=n), categories=segments)
+    return customers
+
+
+def generate_products(n=50, columns='minimal'):
+    """
+    Generate fake product catalog; 'minimal' has a stock count, 'expanded'
+    has cost, sku and weight_kg instead
+    """
+    _check_columns(columns)
+    categories = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys']
+    products = pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [fake.catch_phrase() for _ in range(n)],
+        'category': pd.Categorical(rng.choice(categories, size=n), categories=categories),
+        'price': rng.uniform(10.0, 500.0, size=n).round(2).astype(np.float32)
+    })
+    if columns == 'expanded':
+        products['cost'] = rng.uniform(5.0, 300.0, size=n).round(2).astype(np.float32)
+        products['sku'] = bothify('??-####', n)
+        products['weight_kg'] = rng.uniform(0.1, 10.0, size=n).round(2).astype(np.float32)
+    else:
+        products['stock'] = rng.integers(0, 1001, size=n, dtype=np.int16)
+    return products
+
+
+def generate_orders(customers_df, products_df, n=500, columns='minimal'):
+    """
+    Generate fake orders and their items; 'expanded' adds the 'processing'
+    order status
+    """
+    _check_columns(columns)
+    statuses = ['completed', 'pending', 'cancelled']
+    if columns == 'expanded':
+        statuses.append('processing')
+
+    # Draw every order's item count, product and quantity up front; the item
+    # table is then built column-wise, with no per-item dict or DataFrame sample
+    product_ids = products_df['id'].to_numpy()
+    prices = products_df['price'].to_numpy()
+    num_items_per_order = rng.integers(1, 6, size=n)
+    total_items = int(num_items_per_order.sum())
+    product_idx = rng.integers(0, len(products_df), size=total_items)
+    quantities = rng.integers(1, 4, size=total_items, dtype=np.int8)
+    customer_ids = rng.choice(customers_df['id'].to_numpy(), size=n)
+    order_statuses = rng.choice(statuses, size=n)
+
+    order_ids = np.arange(1, n + 1, dtype=np.int32)
+    item_prices = prices[product_idx]
+    item_totals = item_prices * quantities
+    order_items = pd.DataFrame({
+        'id': np.arange(1, total_items + 1, dtype=np.int32),
+        'order_id': np.repeat(order_ids, num_items_per_order),
+        'product_id': product_ids[product_idx],
+        'quantity': quantities,
+        'price': item_prices,
+        'total': item_totals
+    })
+    order_totals = np.bincount(
+        np.repeat(np.arange(n), num_items_per_order), weights=item_totals, minlength=n
+    )
+
+    orders_df = pd.DataFrame({
+        'id': order_ids,
+        'customer_id': customer_ids,
+        'order_date': random_timestamps(-365, 0, n),
+        'total_amount': order_totals.round(2),
+        'status': pd.Categorical(order_statuses, categories=statuses)
+    })
+    return orders_df, order_items
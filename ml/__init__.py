@@ -2,6 +2,14 @@
 TransformDash ML Module
 Machine Learning infrastructure for training, versioning, and serving models
 """
-from ml.registry.model_registry import ModelRegistry, model_registry
+from ml.registry.model_registry import ModelRegistry
 
 __all__ = ['ModelRegistry', 'model_registry']
+
+
+def __getattr__(name):
+    # Defer creating the global registry until it's first used
+    if name == 'model_registry':
+        from ml.registry.model_registry import model_registry
+        return model_registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,6 @@ import pandas as pd
 import numpy as np
 from typing import Union, List, Dict, Any
 import logging
-from ml.registry.model_registry import model_registry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,7 +24,11 @@ class MLPredictor:
         cache_key = f"{model_name}_{version}" if version else model_name
 
         if cache_key not in self.loaded_models:
-            model = model_registry.load_model(model_name, version)
+            # Deferred so importing the predictor doesn't create the registry
+            from ml.registry.model_registry import model_registry
+
+            # Inference never mutates the model, so map its arrays read-only
+            model = model_registry.load_model(model_name, version, mmap_mode='r')
             metadata = model_registry.get_model_metadata(model_name, version)
             self.loaded_models[cache_key] = {
                 "model": model,
@@ -203,6 +206,8 @@ if __name__ == "__main__":
     print("ML Predictor Test\n")
     print("=" * 60)
 
+    from ml.registry.model_registry import model_registry
+
     # List available models
     models = model_registry.list_models()
     if models:
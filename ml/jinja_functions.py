@@ -5,7 +5,6 @@ These functions can be used directly in dbt models
 import pandas as pd
 from typing import List, Union, Dict, Any
 from ml.inference.predictor import ml_predictor
-from ml.registry.model_registry import model_registry
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +34,8 @@ def ml_predict(model_name: str, feature_columns: List[str], version: str = None,
         SQL expression for prediction
     """
     try:
+        from ml.registry.model_registry import model_registry
+
         # Verify model exists
         metadata = model_registry.get_model_metadata(model_name, version)
 
@@ -144,6 +145,8 @@ def ml_models_list() -> str:
         SQL comment with available models
     """
     try:
+        from ml.registry.model_registry import model_registry
+
         models = model_registry.list_models()
 
         if not models:
@@ -1,3 +1,5 @@
-from ml.registry.model_registry import ModelRegistry, model_registry
+from ml.registry.model_registry import ModelRegistry
 
-__all__ = ['ModelRegistry', 'model_registry']
+# The shared registry is ml.registry.model_registry.model_registry, created on
+# first access; at package level that name is the submodule itself
+__all__ = ['ModelRegistry']
@@ -2,6 +2,7 @@
 Model Registry - Manages trained ML models with versioning and metadata
 """
 import json
+import os
 import pickle
 import joblib
 from pathlib import Path
@@ -9,33 +10,163 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize registry data with orjson when installed, stdlib json otherwise"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize registry data with orjson when installed, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ModelRegistry:
     """
     Central registry for managing ML models
     Stores models, metadata, and provides versioning
     """
 
-    def __init__(self, registry_dir: str = "ml/models"):
+    def __init__(self, registry_dir: str = "ml/models", compact_threshold: int = 100):
         self.registry_dir = Path(registry_dir)
         self.registry_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.registry_dir / "registry.json"
+        # Mutations are appended here and folded into registry.json on compact()
+        self.log_path = self.registry_dir / "registry.log.jsonl"
+        self.compact_threshold = compact_threshold
+        self._log_ops = 0
         self.metadata = self._load_metadata()
+        self._version_index: Dict[tuple, int] = {}
+        for model_name in self.metadata["models"]:
+            self._reindex(model_name)
+        self._seq = self._init_sequence()
+        # Latest version per model, maintained on register/delete
+        self._latest_version: Dict[str, str] = {
+            model_name: max(versions, key=lambda x: x["_seq"])["version"]
+            for model_name, versions in self.metadata["models"].items()
+        }
+
+    def _init_sequence(self) -> int:
+        """
+        Return the highest insertion sequence number in the registry.
+        Entries registered before sequences existed are numbered first, in
+        registered_at order, so they always sort before newer entries.
+        """
+        seq = 0
+        legacy = []
+        for versions in self.metadata["models"].values():
+            for entry in versions:
+                if "_seq" in entry:
+                    seq = max(seq, entry["_seq"])
+                else:
+                    legacy.append(entry)
+
+        for i, entry in enumerate(sorted(legacy, key=lambda x: x["registered_at"]), 1):
+            entry["_seq"] = i
+
+        return max(seq, len(legacy))
+
+    def _reindex(self, model_name: str):
+        """Rebuild the (model_name, version) -> list position index for one model"""
+        for i, entry in enumerate(self.metadata["models"].get(model_name, [])):
+            self._version_index[(model_name, entry["version"])] = i
+
+    def _find_version(self, model_name: str, version: str) -> Optional[Dict]:
+        """Look up a version entry via the index instead of scanning the list"""
+        idx = self._version_index.get((model_name, version))
+        if idx is None:
+            return None
+        return self.metadata["models"][model_name][idx]
+
+    @staticmethod
+    def _public(entry: Dict) -> Dict:
+        """Copy of a version entry without the internal _seq ordering key"""
+        return {key: value for key, value in entry.items() if key != "_seq"}
+
+    def _latest_entry(self, model_name: str) -> Dict:
+        """Return the most recently registered entry for a model"""
+        return self._find_version(model_name, self._latest_version[model_name])
 
     def _load_metadata(self) -> Dict:
-        """Load registry metadata from JSON file"""
+        """Load the registry.json snapshot and replay the operations log on top"""
+        metadata = {"models": {}}
         if self.metadata_file.exists():
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
-        return {"models": {}}
+            metadata = _loads(self.metadata_file.read_bytes())
+
+        if self.log_path.exists():
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        self._apply_op(metadata, _loads(line))
+                        self._log_ops += 1
+
+        return metadata
+
+    @staticmethod
+    def _apply_op(metadata: Dict, record: Dict):
+        """Apply a single logged register/delete operation to metadata"""
+        models = metadata["models"]
+
+        if record["op"] == "register":
+            entry = record["entry"]
+            versions = models.setdefault(entry["model_name"], [])
+            # Re-registering a version replaces it, as register_model does;
+            # that also keeps replays idempotent if a compaction was interrupted
+            for i, m in enumerate(versions):
+                if m["version"] == entry["version"]:
+                    versions[i] = entry
+                    break
+            else:
+                versions.append(entry)
+        elif record["op"] == "delete":
+            model_name = record["model_name"]
+            version = record.get("version")
+            if version is None:
+                models.pop(model_name, None)
+            else:
+                remaining = [m for m in models.get(model_name, []) if m["version"] != version]
+                if remaining:
+                    models[model_name] = remaining
+                else:
+                    models.pop(model_name, None)
+
+    def _append_log(self, record: Dict):
+        """Durably append one operation to the log, compacting when it grows too long"""
+        with open(self.log_path, 'ab') as f:
+            f.write(_dumps(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._log_ops += 1
+        if self._log_ops >= self.compact_threshold:
+            self.compact()
 
     def _save_metadata(self):
         """Save registry metadata to JSON file"""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2, default=str)
+        self.metadata_file.write_bytes(_dumps(self.metadata, indent=True))
+
+    def compact(self):
+        """Rewrite registry.json from the in-memory state and truncate the log"""
+        self._save_metadata()
+        if self.log_path.exists():
+            self.log_path.unlink()
+        self._log_ops = 0
+        logger.info("✓ Compacted model registry")
 
     def register_model(
         self,
@@ -70,9 +201,11 @@ class ModelRegistry:
         Returns:
             model_id: Unique identifier for the registered model
         """
+        now = datetime.now()
+
         # Generate version if not provided
         if version is None:
-            version = datetime.now().strftime("%Y%m%d_%H%M%S")
+            version = now.strftime("%Y%m%d_%H%M%S")
 
         model_id = f"{model_name}_v{version}"
 
@@ -103,7 +236,7 @@ class ModelRegistry:
             "model_class": model_class,
             "model_path": str(model_path),
             "model_size_mb": round(model_size_mb, 2),
-            "registered_at": datetime.now().isoformat(),
+            "registered_at": now.isoformat(),
             "metrics": metrics or {},
             "feature_columns": feature_columns or [],
             "target_column": target_column,
@@ -113,13 +246,21 @@ class ModelRegistry:
             "training_config": training_config or {},
             "status": "active"
         }
-
-        # Store in registry
-        if model_name not in self.metadata["models"]:
-            self.metadata["models"][model_name] = []
-
-        self.metadata["models"][model_name].append(metadata_entry)
-        self._save_metadata()
+        # Integer sort key for "latest" lookups; registered_at is for display
+        self._seq += 1
+        metadata_entry["_seq"] = self._seq
+
+        # Store in registry. Registering an existing version replaces its
+        # entry (its artifact was just overwritten), both here and on replay
+        versions = self.metadata["models"].setdefault(model_name, [])
+        idx = self._version_index.get((model_name, version))
+        if idx is None:
+            versions.append(metadata_entry)
+            self._version_index[(model_name, version)] = len(versions) - 1
+        else:
+            versions[idx] = metadata_entry
+        self._latest_version[model_name] = version
+        self._append_log({"op": "register", "entry": metadata_entry})
 
         logger.info(f"✓ Registered model: {model_id}")
         logger.info(f"  Type: {model_type}")
@@ -127,13 +268,21 @@ class ModelRegistry:
 
         return model_id
 
-    def load_model(self, model_name: str, version: Optional[str] = None) -> Any:
+    def load_model(
+        self,
+        model_name: str,
+        version: Optional[str] = None,
+        mmap_mode: Optional[str] = None
+    ) -> Any:
         """
         Load a model from the registry
 
         Args:
             model_name: Name of the model
             version: Specific version to load (loads latest if not specified)
+            mmap_mode: Memory-map numpy arrays from disk (e.g. 'r') instead of
+                copying them into memory, so workers share the page cache.
+                Only works for uncompressed artifacts (the register_model default)
 
         Returns:
             Loaded model object
@@ -141,26 +290,21 @@ class ModelRegistry:
         if model_name not in self.metadata["models"]:
             raise ValueError(f"Model '{model_name}' not found in registry")
 
-        versions = self.metadata["models"][model_name]
-
         if version:
             # Find specific version
-            model_entry = next(
-                (m for m in versions if m["version"] == version),
-                None
-            )
+            model_entry = self._find_version(model_name, version)
             if not model_entry:
                 raise ValueError(f"Version '{version}' not found for model '{model_name}'")
         else:
             # Get latest version
-            model_entry = max(versions, key=lambda x: x["registered_at"])
+            model_entry = self._latest_entry(model_name)
 
         model_path = Path(model_entry["model_path"])
 
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
 
-        model = joblib.load(model_path)
+        model = joblib.load(model_path, mmap_mode=mmap_mode)
         logger.info(f"✓ Loaded model: {model_entry['model_id']}")
 
         return model
@@ -170,26 +314,21 @@ class ModelRegistry:
         if model_name not in self.metadata["models"]:
             raise ValueError(f"Model '{model_name}' not found in registry")
 
-        versions = self.metadata["models"][model_name]
-
         if version:
-            model_entry = next(
-                (m for m in versions if m["version"] == version),
-                None
-            )
+            model_entry = self._find_version(model_name, version)
             if not model_entry:
                 raise ValueError(f"Version '{version}' not found for model '{model_name}'")
-            return model_entry
+            return self._public(model_entry)
         else:
             # Return latest version
-            return max(versions, key=lambda x: x["registered_at"])
+            return self._public(self._latest_entry(model_name))
 
     def list_models(self) -> List[Dict]:
         """List all registered models with their latest versions"""
         models_list = []
 
         for model_name, versions in self.metadata["models"].items():
-            latest = max(versions, key=lambda x: x["registered_at"])
+            latest = self._latest_entry(model_name)
             models_list.append({
                 "model_name": model_name,
                 "latest_version": latest["version"],
@@ -211,11 +350,12 @@ class ModelRegistry:
         if model_name not in self.metadata["models"]:
             raise ValueError(f"Model '{model_name}' not found in registry")
 
-        return sorted(
+        versions = sorted(
             self.metadata["models"][model_name],
-            key=lambda x: x["registered_at"],
+            key=lambda x: x["_seq"],
             reverse=True
         )
+        return [self._public(entry) for entry in versions]
 
     def get_model_info(self, model_name: str, version: str = None) -> Dict:
         """
@@ -229,6 +369,7 @@ class ModelRegistry:
             Detailed model information dictionary
         """
         metadata = self.get_model_metadata(model_name, version)
+        feature_columns = metadata.get("feature_columns", [])
 
         # Format the information nicely
         info = {
@@ -242,8 +383,8 @@ class ModelRegistry:
             "tags": metadata.get("tags", []),
             "metrics": metadata.get("metrics", {}),
             "features": {
-                "feature_columns": metadata.get("feature_columns", []),
-                "num_features": len(metadata.get("feature_columns", [])),
+                "feature_columns": feature_columns,
+                "num_features": len(feature_columns),
                 "target_column": metadata.get("target_column", "")
             },
             "model_path": metadata["model_path"]
@@ -262,10 +403,7 @@ class ModelRegistry:
         if version:
             # Delete specific version
             versions = self.metadata["models"][model_name]
-            model_entry = next(
-                (m for m in versions if m["version"] == version),
-                None
-            )
+            model_entry = self._find_version(model_name, version)
 
             if not model_entry:
                 raise ValueError(f"Version '{version}' not found")
@@ -275,15 +413,18 @@ class ModelRegistry:
             if model_path.exists():
                 model_path.unlink()
 
-            # Remove from metadata
-            self.metadata["models"][model_name] = [
-                m for m in versions if m["version"] != version
-            ]
+            # Remove from metadata and shift the positions of later versions
+            del versions[self._version_index.pop((model_name, version))]
+            self._reindex(model_name)
 
             # If no versions left, remove model entry
-            if len(self.metadata["models"][model_name]) == 0:
+            if len(versions) == 0:
                 del self.metadata["models"][model_name]
+                del self._latest_version[model_name]
+            elif self._latest_version[model_name] == version:
+                self._latest_version[model_name] = max(versions, key=lambda x: x["_seq"])["version"]
 
+            self._append_log({"op": "delete", "model_name": model_name, "version": version})
             logger.info(f"✓ Deleted model version: {model_name}_v{version}")
         else:
             # Delete all versions
@@ -293,15 +434,24 @@ class ModelRegistry:
                 model_path = Path(model_entry["model_path"])
                 if model_path.exists():
                     model_path.unlink()
+                self._version_index.pop((model_name, model_entry["version"]), None)
 
             del self.metadata["models"][model_name]
+            del self._latest_version[model_name]
+            self._append_log({"op": "delete", "model_name": model_name, "version": None})
             logger.info(f"✓ Deleted all versions of model: {model_name}")
 
-        self._save_metadata()
-
 
-# Global registry instance
-model_registry = ModelRegistry()
+def __getattr__(name: str) -> Any:
+    """
+    Create the global registry instance on first access (PEP 562) so importing
+    this module doesn't touch the filesystem until the registry is used
+    """
+    if name == "model_registry":
+        global model_registry
+        model_registry = ModelRegistry()
+        return model_registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -309,6 +459,8 @@ if __name__ == "__main__":
     print("Testing Model Registry\n")
     print("=" * 60)
 
+    model_registry = ModelRegistry()
+
     # List all models
     print("\n📋 Registered Models:")
     models = model_registry.list_models()
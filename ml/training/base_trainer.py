@@ -11,7 +11,6 @@ from sklearn.metrics import (
 )
 import logging
 from abc import ABC, abstractmethod
-from ml.registry.model_registry import model_registry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,6 +37,7 @@ class BaseTrainer(ABC):
         self.feature_columns = None
         self.target_column = None
         self.metrics = {}
+        self._dtype = np.float32
 
     @abstractmethod
     def build_model(self, **kwargs) -> Any:
@@ -59,7 +59,9 @@ class BaseTrainer(ABC):
         self,
         query: str = None,
         df: pd.DataFrame = None,
-        connection_id: str = None
+        connection_id: str = None,
+        pg: Any = None,
+        chunksize: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Load training data from SQL query or DataFrame
@@ -68,6 +70,10 @@ class BaseTrainer(ABC):
             query: SQL query to fetch data
             df: Pre-loaded DataFrame
             connection_id: Database connection ID
+            pg: Already-connected PostgresConnector to reuse across queries
+                (connection_id is ignored when provided)
+            chunksize: Stream the query result from a server-side cursor this
+                many rows at a time, for pulls too large to buffer at once
 
         Returns:
             DataFrame with training data
@@ -79,14 +85,28 @@ class BaseTrainer(ABC):
         if query is None:
             raise ValueError("Must provide either query or df")
 
-        from connection_manager import connection_manager
+        if pg is not None:
+            df = pg.query_to_dataframe(query, chunksize=chunksize)
+        else:
+            # Deferred so importing ml.training doesn't require connections.yml
+            from connection_manager import connection_manager
 
-        with connection_manager.get_connection(connection_id) as pg:
-            df = pg.query_to_dataframe(query)
+            with connection_manager.get_connection(connection_id) as conn:
+                df = conn.query_to_dataframe(query, chunksize=chunksize)
 
         logger.info(f"✓ Loaded {len(df)} rows from query")
         return df
 
+    def _to_model_input(self, X: pd.DataFrame) -> Any:
+        """
+        Cast features to the dtype the model is fitted on. DataFrames stay
+        DataFrames so the model records feature_names_in_ and checks the
+        column order of what the predictor later passes in
+        """
+        if isinstance(X, pd.DataFrame):
+            return X.astype(self._dtype)
+        return X
+
     def split_data(
         self,
         df: pd.DataFrame,
@@ -146,8 +166,13 @@ class BaseTrainer(ABC):
         if self.model is None:
             self.model = self.build_model(**kwargs)
 
+        # Features are cast to float32 once, up front; labels are left as-is
+        # since classifiers need the original classes
+        X_train = self._to_model_input(X_train)
+        y_arr = y_train.to_numpy() if isinstance(y_train, pd.Series) else y_train
+
         logger.info("🚀 Training model...")
-        self.model.fit(X_train, y_train)
+        self.model.fit(X_train, np.ascontiguousarray(y_arr))
         logger.info("✓ Training complete")
 
         return self.model
@@ -158,7 +183,7 @@ class BaseTrainer(ABC):
         y_test: pd.Series
     ) -> Dict[str, float]:
         """Evaluate classification model"""
-        y_pred = self.model.predict(X_test)
+        y_pred = self.model.predict(self._to_model_input(X_test))
 
         metrics = {
             "accuracy": float(accuracy_score(y_test, y_pred)),
@@ -175,7 +200,7 @@ class BaseTrainer(ABC):
         y_test: pd.Series
     ) -> Dict[str, float]:
         """Evaluate regression model"""
-        y_pred = self.model.predict(X_test)
+        y_pred = self.model.predict(self._to_model_input(X_test))
 
         metrics = {
             "mse": float(mean_squared_error(y_test, y_pred)),
@@ -229,6 +254,8 @@ class BaseTrainer(ABC):
         if self.model is None:
             raise ValueError("No model to register. Train model first.")
 
+        from ml.registry.model_registry import model_registry
+
         model_id = model_registry.register_model(
             model=self.model,
             model_name=self.model_name,
@@ -251,6 +278,8 @@ class BaseTrainer(ABC):
         connection_id: str = None,
         test_size: float = 0.2,
         version: str = None,
+        pg: Any = None,
+        chunksize: Optional[int] = None,
         **model_kwargs
     ) -> Tuple[str, Dict[str, float]]:
         """
@@ -263,13 +292,17 @@ class BaseTrainer(ABC):
             connection_id: Database connection ID
             test_size: Test set proportion
             version: Model version
+            pg: Already-connected PostgresConnector to load data with
+            chunksize: Rows per fetch when streaming the query (see load_data)
             **model_kwargs: Additional model parameters
 
         Returns:
             (model_id, metrics): Registered model ID and evaluation metrics
         """
         # Load data
-        data = self.load_data(query=query, df=df, connection_id=connection_id)
+        data = self.load_data(
+            query=query, df=df, connection_id=connection_id, pg=pg, chunksize=chunksize
+        )
 
         # Preprocess
         data = self.preprocess_features(data)
@@ -2,8 +2,9 @@
 Customer Churn Prediction Trainer
 Example implementation using the BaseTrainer
 """
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from ml.training.base_trainer import BaseTrainer
 
 
@@ -17,21 +18,26 @@ class ChurnTrainer(BaseTrainer):
         super().__init__(
             model_name="customer_churn",
             model_type="classification",
-            description="Predicts customer churn probability using Random Forest",
-            tags=["customer", "churn", "classification", "rf"]
+            description="Predicts customer churn probability using histogram gradient boosting",
+            tags=["customer", "churn", "classification", "hgb"]
         )
 
-    def build_model(self, **kwargs) -> RandomForestClassifier:
-        """Build Random Forest classifier"""
+    def build_model(self, **kwargs) -> HistGradientBoostingClassifier:
+        """
+        Build histogram-based gradient boosting classifier
+        Features are binned once up front, so fitting is much faster than a
+        Random Forest on tabular data of this size
+        """
         default_params = {
-            'n_estimators': 100,
-            'max_depth': 10,
-            'min_samples_split': 5,
+            'max_iter': 200,
+            'max_depth': 8,
+            'learning_rate': 0.1,
+            'l2_regularization': 1.0,
             'random_state': 42
         }
         default_params.update(kwargs)
 
-        return RandomForestClassifier(**default_params)
+        return HistGradientBoostingClassifier(**default_params)
 
     def preprocess_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -57,11 +63,14 @@ class ChurnTrainer(BaseTrainer):
             # Engagement score
             df['engagement_score'] = df['frequency'] / (df['recency'] + 1)
 
-        # Remove outliers (optional)
-        for col in ['monetary', 'frequency', 'recency']:
-            if col in df.columns:
-                q99 = df[col].quantile(0.99)
-                df[col] = df[col].clip(upper=q99)
+        # Remove outliers (optional) - cap at the 99th percentile, computing
+        # all columns' percentiles in one pass and clipping in place
+        cols = [c for c in ['monetary', 'frequency', 'recency'] if c in df.columns]
+        if cols:
+            values = df[cols].to_numpy(dtype=np.float64, copy=True)
+            q99 = np.percentile(values, 99, axis=0)
+            np.minimum(values, q99, out=values)
+            df[cols] = values
 
         return df
 
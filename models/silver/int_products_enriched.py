@@ -50,8 +50,9 @@ def model(dbt):
             .str.title()
         )
 
-    # Flag discontinued products
+    # Flag discontinued products - cast before inverting so the column is a
+    # 1-byte bool rather than object (~ on object-dtype True gives -2)
     if 'discontinued' in products_df.columns:
-        products_df['is_active'] = ~products_df['discontinued'].fillna(False)
+        products_df['is_active'] = ~products_df['discontinued'].fillna(False).astype(bool)
 
     return products_df
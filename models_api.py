@@ -5,7 +5,10 @@ Handles listing, viewing, and running transformation models
 import logging
 import json
 import sys
+import heapq
+from collections import defaultdict, deque
 from pathlib import Path
+from typing import Dict, List
 from fastapi import HTTPException, Request
 from fastapi.responses import StreamingResponse
 import asyncio
@@ -15,38 +18,96 @@ sys.path.append(str(Path(__file__).parent))
 from error_utils import log_and_raise_error
 
 from transformations.model_loader import ModelLoader
+from transformations.model import TransformationModel
 from orchestration.engine import TransformationEngine
 
+MODELS_DIR = Path(__file__).parent / "models"
+LOADER = ModelLoader(models_dir=str(MODELS_DIR))
+
+
+def _model_to_dict(model: TransformationModel) -> Dict:
+    """JSON-serializable summary of a model; config/file_path are set by the loader"""
+    return {
+        'name': model.name,
+        'type': model.model_type.value,
+        'depends_on': model.depends_on,
+        'status': model.status,
+        'config': getattr(model, 'config', {}),
+        'file_path': getattr(model, 'file_path', None)
+    }
+
+
+def _with_dependencies(
+    target_model: TransformationModel,
+    all_models: List[TransformationModel]
+) -> List[TransformationModel]:
+    """
+    Return the target's transitive dependencies plus the target itself, in
+    topological order (Kahn's algorithm, ties broken by load order).
+    Iterative, so deep DAGs don't hit the recursion limit.
+    """
+    by_name = {m.name: m for m in all_models}
+    position = {m.name: i for i, m in enumerate(all_models)}
+
+    # Collect every model the target transitively depends on
+    needed = {target_model.name}
+    queue = deque([target_model])
+    while queue:
+        model = queue.popleft()
+        for dep_name in model.depends_on:
+            if dep_name in by_name and dep_name not in needed:
+                needed.add(dep_name)
+                queue.append(by_name[dep_name])
+
+    # Topologically sort the induced subgraph
+    in_degree = {}
+    dependents = defaultdict(list)
+    for name in needed:
+        deps = [d for d in by_name[name].depends_on if d in needed]
+        in_degree[name] = len(deps)
+        for dep_name in deps:
+            dependents[dep_name].append(name)
+
+    ready = [(position[name], name) for name, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, name = heapq.heappop(ready)
+        ordered.append(by_name[name])
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, (position[dependent], dependent))
+
+    if len(ordered) != len(needed):
+        raise ValueError(f"Cycle detected in dependencies of model: {target_model.name}")
+
+    return ordered
+
 
 async def get_all_models():
     """Get all transformation models (SQL + Python)"""
     try:
         logging.info("Loading all transformation models")
 
-        models_dir = Path(__file__).parent / "models"
-        loader = ModelLoader(models_dir=str(models_dir))
-
         # Load all models
-        models = loader.load_all_models()
+        models = LOADER.load_all_models(cached=True)
 
         # Convert to JSON-serializable format
-        models_list = []
-        for model in models:
-            model_dict = {
-                'name': model.name,
-                'type': model.model_type.value,
-                'depends_on': model.depends_on,
-                'status': model.status,
-                'config': getattr(model, 'config', {}),
-                'file_path': getattr(model, 'file_path', None)
-            }
-            models_list.append(model_dict)
-
-        # Group by layer
-        bronze = [m for m in models_list if m['name'].startswith('stg_')]
-        silver = [m for m in models_list if m['name'].startswith('int_')]
-        gold = [m for m in models_list if m['name'].startswith('fct_')]
-        other = [m for m in models_list if m not in bronze + silver + gold]
+        models_list = [_model_to_dict(model) for model in models]
+
+        # Group by layer in a single pass
+        bronze, silver, gold, other = [], [], [], []
+        for m in models_list:
+            name = m['name']
+            if name.startswith('stg_'):
+                bronze.append(m)
+            elif name.startswith('int_'):
+                silver.append(m)
+            elif name.startswith('fct_'):
+                gold.append(m)
+            else:
+                other.append(m)
 
         logging.info(f"Loaded {len(models_list)} models")
 
@@ -71,30 +132,21 @@ async def get_model_by_name(model_name: str):
     try:
         logging.info(f"Loading model: {model_name}")
 
-        models_dir = Path(__file__).parent / "models"
-        loader = ModelLoader(models_dir=str(models_dir))
-
         # Load all models and find the one we want
-        models = loader.load_all_models()
+        models = LOADER.load_all_models(cached=True)
         model = next((m for m in models if m.name == model_name), None)
 
         if not model:
             raise HTTPException(status_code=404, detail=f"Model '{model_name}' not found")
 
-        model_dict = {
-            'name': model.name,
-            'type': model.model_type.value,
-            'depends_on': model.depends_on,
-            'status': model.status,
-            'config': getattr(model, 'config', {}),
-            'file_path': getattr(model, 'file_path', None)
-        }
+        model_dict = _model_to_dict(model)
 
-        # Read file content if available
+        # Read file content if available (off the event loop)
         if model_dict['file_path']:
             try:
-                with open(model_dict['file_path'], 'r') as f:
-                    model_dict['content'] = f.read()
+                model_dict['content'] = await asyncio.to_thread(
+                    Path(model_dict['file_path']).read_text
+                )
             except:
                 model_dict['content'] = None
 
@@ -120,25 +172,23 @@ async def run_models(request: Request):
         else:
             logging.info("Running all transformation models")
 
-        models_dir = Path(__file__).parent / "models"
-        loader = ModelLoader(models_dir=str(models_dir))
-
         # Load models
-        all_models = loader.load_all_models()
+        all_models = LOADER.load_all_models(cached=True)
 
         # Filter to specific models if requested
         if model_names:
-            models_to_run = [m for m in all_models if m.name in model_names]
-            if len(models_to_run) != len(model_names):
-                found_names = [m.name for m in models_to_run]
+            wanted = set(model_names)
+            models_to_run = [m for m in all_models if m.name in wanted]
+            if len(models_to_run) != len(wanted):
+                found_names = {m.name for m in models_to_run}
                 missing = [n for n in model_names if n not in found_names]
                 raise HTTPException(status_code=404, detail=f"Models not found: {missing}")
         else:
             models_to_run = all_models
 
-        # Run models
+        # Run models in a worker thread so the event loop keeps serving requests
         engine = TransformationEngine(models_to_run)
-        context = engine.run(verbose=True)
+        context = await asyncio.to_thread(engine.run, True)
 
         # Get summary
         summary = context.get_summary()
@@ -171,39 +221,21 @@ async def run_single_model(model_name: str):
     try:
         logging.info(f"Running single model: {model_name}")
 
-        models_dir = Path(__file__).parent / "models"
-        loader = ModelLoader(models_dir=str(models_dir))
-
         # Load all models (need dependencies)
-        all_models = loader.load_all_models()
+        all_models = LOADER.load_all_models(cached=True)
 
         # Find the target model
         target_model = next((m for m in all_models if m.name == model_name), None)
         if not target_model:
             raise HTTPException(status_code=404, detail=f"Model '{model_name}' not found")
 
-        # Get all dependencies (recursively)
-        def get_dependencies(model_name, all_models):
-            model = next((m for m in all_models if m.name == model_name), None)
-            if not model:
-                return []
-
-            deps = []
-            for dep_name in model.depends_on:
-                deps.extend(get_dependencies(dep_name, all_models))
-                dep_model = next((m for m in all_models if m.name == dep_name), None)
-                if dep_model and dep_model not in deps:
-                    deps.append(dep_model)
-
-            return deps
-
-        # Get all models needed (dependencies + target)
-        dependency_models = get_dependencies(model_name, all_models)
-        models_to_run = dependency_models + [target_model]
+        # Get all models needed (dependencies in execution order, then target)
+        models_to_run = _with_dependencies(target_model, all_models)
+        dependency_models = models_to_run[:-1]
 
-        # Run models
+        # Run models in a worker thread so the event loop keeps serving requests
         engine = TransformationEngine(models_to_run)
-        context = engine.run(verbose=True)
+        context = await asyncio.to_thread(engine.run, True)
 
         # Get summary
         summary = context.get_summary()
@@ -1,14 +1,50 @@
+import atexit
+import threading
+
 from pymongo import MongoClient
 
+# Clients are shared per URI: each MongoClient owns a connection pool and
+# monitor threads, and serves every database on that deployment
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(uri):
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            client = _clients[uri] = MongoClient(uri, maxPoolSize=50)
+        return client
+
+
+@atexit.register
+def _close_clients():
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
 class MongoConnector:
     def __init__(self, uri="mongodb://localhost:27017", dbname="testdb"):
-        self.client = MongoClient(uri)
+        self.client = _get_client(uri)
         self.db = self.client[dbname]
 
     def insert(self, collection_name, document):
         collection = self.db[collection_name]
         return collection.insert_one(document).inserted_id
 
+    def insert_many(self, collection_name, documents, ordered=False):
+        # One round-trip for the whole batch; unordered lets the server
+        # apply writes in parallel and continue past individual failures
+        collection = self.db[collection_name]
+        return collection.insert_many(documents, ordered=ordered).inserted_ids
+
+    def bulk_write(self, collection_name, operations, ordered=False):
+        # Mixed batches of pymongo InsertOne/UpdateOne/DeleteOne/... requests
+        collection = self.db[collection_name]
+        return collection.bulk_write(operations, ordered=ordered)
+
     def find(self, collection_name, query=None):
         collection = self.db[collection_name]
         return list(collection.find(query or {}))
@@ -22,7 +58,10 @@ class MongoConnector:
         return collection.delete_many(filter_query)
 
     def close(self):
-        self.client.close()
+        # Release this connector's reference; the shared client stays open for
+        # other connectors and is closed at exit
+        self.client = None
+        self.db = None
 
 # Usage example
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """
 Orchestration Engine - Executes transformations in DAG order
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from transformations import TransformationModel, DAG
 
@@ -54,8 +54,14 @@ class ExecutionContext:
 class TransformationEngine:
     """Main orchestration engine that executes DAG of transformations"""
 
-    def __init__(self, models: List[TransformationModel]):
-        self.dag = DAG(models)
+    def __init__(self, models: List[TransformationModel], dag: Optional[DAG] = None):
+        """
+        Args:
+            models: Models to execute
+            dag: Already-built DAG for these models (e.g. from validation),
+                so the graph isn't rebuilt and re-sorted
+        """
+        self.dag = dag if dag is not None else DAG(models)
         self.context = ExecutionContext()
 
     def run(self, verbose: bool = True) -> ExecutionContext:
@@ -1,10 +1,101 @@
+import csv
+import io
+import threading
+import uuid
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import pool, sql
+from psycopg2.extras import RealDictCursor, execute_values
 import pandas as pd
 from typing import Optional, List, Dict, Any
 from config import config
 from sqlalchemy import create_engine
-from sqlalchemy.engine import URL
+from sqlalchemy.engine import URL, Engine
+
+_GET_TABLES_SQL = """
+    SELECT tablename
+    FROM pg_tables
+    WHERE schemaname = 'public'
+    ORDER BY tablename;
+"""
+
+_GET_TABLE_INFO_SQL = """
+    SELECT
+        column_name,
+        data_type,
+        is_nullable,
+        column_default
+    FROM information_schema.columns
+    WHERE table_name = %s
+    ORDER BY ordinal_position;
+"""
+
+# One connection pool per set of connection parameters, created on first use
+_POOLS: Dict[tuple, pool.ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(conn_params: Dict[str, Any]) -> pool.ThreadedConnectionPool:
+    """Return the shared pool for these connection parameters, creating it if needed"""
+    key = tuple(sorted(conn_params.items()))
+    conn_pool = _POOLS.get(key)
+    if conn_pool is None:
+        with _POOLS_LOCK:
+            conn_pool = _POOLS.get(key)
+            if conn_pool is None:
+                conn_pool = pool.ThreadedConnectionPool(
+                    config.POSTGRES_POOL_MIN,
+                    config.POSTGRES_POOL_MAX,
+                    **conn_params
+                )
+                _POOLS[key] = conn_pool
+    return conn_pool
+
+
+def _copy_insert(table, conn, keys, data_iter):
+    """
+    pandas.to_sql insertion method that bulk-loads rows with COPY FROM STDIN
+    instead of multi-row INSERT statements
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows(data_iter)
+    buf.seek(0)
+
+    target = (
+        sql.Identifier(table.schema, table.name) if table.schema
+        else sql.Identifier(table.name)
+    )
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        target, sql.SQL(', ').join(map(sql.Identifier, keys))
+    )
+
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(copy_sql, buf)
+
+
+class _ChunkReader:
+    """Read-only file object over an iterator of str chunks, for copy_expert"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = ''
+        self._pos = 0
+
+    def read(self, size: int = -1) -> str:
+        if size < 0:
+            data = self._pending[self._pos:] + ''.join(self._chunks)
+            self._pending, self._pos = '', 0
+            return data
+        # Hand out the current chunk in slices, pulling the next one when it runs out
+        while self._pos >= len(self._pending):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return ''
+            self._pending, self._pos = chunk, 0
+        data = self._pending[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
 
 class PostgresConnector:
     """
@@ -12,6 +103,9 @@ class PostgresConnector:
     Supports both direct parameters and automatic config loading
     """
 
+    # SQLAlchemy engines (and their pools) keyed by connection parameters
+    _engines: Dict[tuple, Engine] = {}
+
     def __init__(
         self,
         host: Optional[str] = None,
@@ -42,84 +136,159 @@ class PostgresConnector:
                 "password": password,
             }
         self.conn = None
+        self._pool = None
+        self._in_transaction = False
+        self._depth = 0
 
     def connect(self):
-        """Establish database connection"""
-        if self.conn is None or self.conn.closed:
-            self.conn = psycopg2.connect(**self.conn_params)
+        """Establish database connection, reusing a pooled one when available"""
+        if self.conn is not None and self.conn.closed:
+            self.close()
+        if self.conn is None:
+            conn_pool = _get_pool(self.conn_params)
+            try:
+                conn = conn_pool.getconn()
+            except pool.PoolError:
+                # Pool exhausted - fall back to a dedicated connection
+                self.conn = psycopg2.connect(**self.conn_params)
+                self._pool = None
+            else:
+                if conn.closed:
+                    conn_pool.putconn(conn, close=True)
+                    conn = psycopg2.connect(**self.conn_params)
+                    self._pool = None
+                else:
+                    self._pool = conn_pool
+                self.conn = conn
         return self
 
-    def execute(self, query: str, params: Optional[tuple] = None, fetch: bool = False) -> Optional[List[Dict]]:
+    def execute(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        fetch: bool = False,
+        dict_rows: bool = True
+    ) -> Optional[List[Dict]]:
         """
         Execute a SQL query
         Returns list of dicts if fetch=True, None otherwise
+        With dict_rows=False rows are plain tuples, skipping the per-row dict
         """
         if not self.conn or self.conn.closed:
             raise ConnectionError("Not connected to database. Call connect() first.")
 
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cursor_factory = RealDictCursor if dict_rows else None
+        with self.conn.cursor(cursor_factory=cursor_factory) as cur:
             cur.execute(query, params)
             result = cur.fetchall() if fetch else None
-            # Always commit for INSERT/UPDATE/DELETE queries
-            # Handle both string queries and psycopg2.sql.Composed objects
-            query_str = query.as_string(self.conn) if hasattr(query, 'as_string') else str(query)
-            if not query_str.strip().upper().startswith('SELECT'):
-                self.conn.commit()
+            # Commit anything that isn't a plain read. The server's command tag
+            # ("SELECT 5", "INSERT 0 1", ...) classifies the statement without
+            # re-rendering it, and handles WITH ... SELECT and ... RETURNING
+            status = cur.statusmessage or ''
+            if not status.startswith('SELECT'):
+                self._commit()
             return result
 
-    def query_to_dataframe(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+    def execute_values(
+        self,
+        query: str,
+        rows: List[tuple],
+        page_size: int = 1000,
+        template: Optional[str] = None,
+        fetch: bool = False
+    ) -> Optional[List[tuple]]:
+        """
+        Run an INSERT/UPDATE whose single VALUES %s placeholder is expanded
+        with many rows, sending page_size rows per statement instead of one
+        statement per row. Use it where COPY doesn't fit, e.g. ON CONFLICT
+        template overrides the per-row "(%s, ...)" snippet, e.g. to add casts
+        Returns the RETURNING rows of every page if fetch=True, None otherwise
+        """
+        if not self.conn or self.conn.closed:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+        if not rows:
+            return [] if fetch else None
+
+        with self.conn.cursor() as cur:
+            result = execute_values(
+                cur, query, rows, template=template, page_size=page_size, fetch=fetch
+            )
+        self._commit()
+        return result if fetch else None
+
+    def query_to_dataframe(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        chunksize: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Execute query and return results as pandas DataFrame
         Perfect for data transformation pipelines
+
+        If chunksize is set, rows are streamed from a server-side cursor
+        chunksize at a time instead of being buffered client-side all at once,
+        which keeps peak memory down on large result sets (SELECT only)
         """
         if not self.conn or self.conn.closed:
             raise ConnectionError("Not connected to database. Call connect() first.")
 
-        return pd.read_sql_query(query, self.conn, params=params)
+        if chunksize is None:
+            return pd.read_sql_query(query, self.conn, params=params)
+
+        frames = []
+        columns = None
+        with self.conn.cursor(name=f"td_stream_{uuid.uuid4().hex}") as cur:
+            cur.itersize = chunksize
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany(chunksize)
+                if columns is None:
+                    columns = [col[0] for col in cur.description]
+                if not rows:
+                    break
+                frames.append(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True))
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
 
     def get_tables(self) -> List[str]:
         """Get list of all tables in current database"""
-        query = """
-            SELECT tablename
-            FROM pg_tables
-            WHERE schemaname = 'public'
-            ORDER BY tablename;
-        """
-        results = self.execute(query, fetch=True)
-        return [row['tablename'] for row in results]
+        results = self.execute(_GET_TABLES_SQL, fetch=True, dict_rows=False)
+        return [row[0] for row in results]
 
     def get_table_info(self, table_name: str) -> pd.DataFrame:
         """Get column information for a specific table"""
-        query = """
-            SELECT
-                column_name,
-                data_type,
-                is_nullable,
-                column_default
-            FROM information_schema.columns
-            WHERE table_name = %s
-            ORDER BY ordinal_position;
-        """
-        return self.query_to_dataframe(query, (table_name,))
+        return self.query_to_dataframe(_GET_TABLE_INFO_SQL, (table_name,))
+
+    def _get_engine(self) -> Engine:
+        """Return a SQLAlchemy engine for these connection parameters, shared across instances"""
+        key = tuple(sorted(self.conn_params.items()))
+        engine = PostgresConnector._engines.get(key)
+        if engine is None:
+            # Create SQLAlchemy engine URL securely (password not exposed in string representation)
+            url = URL.create(
+                drivername="postgresql+psycopg2",
+                username=self.conn_params['user'],
+                password=self.conn_params['password'],
+                host=self.conn_params['host'],
+                port=self.conn_params['port'],
+                database=self.conn_params['dbname']
+            )
+            engine = create_engine(url, pool_pre_ping=True, pool_size=5)
+            PostgresConnector._engines[key] = engine
+        return engine
 
     def insert_dataframe(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append'):
         """
-        Insert pandas DataFrame into PostgreSQL table using SQLAlchemy
+        Insert pandas DataFrame into PostgreSQL table using SQLAlchemy + COPY
         Args:
             df: DataFrame to insert
             table_name: Target table name (can include schema, e.g., 'raw.customers')
             if_exists: 'fail', 'replace', or 'append' (default)
         """
-        # Create SQLAlchemy engine URL securely (password not exposed in string representation)
-        url = URL.create(
-            drivername="postgresql+psycopg2",
-            username=self.conn_params['user'],
-            password=self.conn_params['password'],
-            host=self.conn_params['host'],
-            port=self.conn_params['port'],
-            database=self.conn_params['dbname']
-        )
-        engine = create_engine(url)
+        engine = self._get_engine()
 
         # Parse table name and schema
         if '.' in table_name:
@@ -128,16 +297,102 @@ class PostgresConnector:
             schema = None
             table = table_name
 
-        # Insert using SQLAlchemy engine
+        # Insert using SQLAlchemy engine (pandas handles table creation,
+        # rows are streamed in with COPY)
         df.to_sql(
             table,
             engine,
             schema=schema,
             if_exists=if_exists,
             index=False,
-            method='multi'
+            method=_copy_insert
+        )
+
+    def copy_dataframe(self, df: pd.DataFrame, table_name: str, chunksize: int = 50000):
+        """
+        Bulk-load a DataFrame into an existing table with COPY FROM STDIN
+        over this connection, skipping the SQLAlchemy engine and to_sql's
+        table reflection. Columns are matched by name; NaN/None load as NULL.
+        The CSV is rendered chunksize rows at a time as COPY reads it, so
+        the whole table is never held as text in memory.
+        Args:
+            df: DataFrame to load
+            table_name: Target table name (can include schema, e.g., 'raw.customers')
+            chunksize: Rows rendered per CSV chunk
+        """
+        chunks = (
+            df.iloc[start:start + chunksize].to_csv(index=False, header=False, na_rep='\\N')
+            for start in range(0, len(df), chunksize)
+        )
+        self._copy_csv(table_name, df.columns, chunks)
+
+    def copy_rows(self, table_name: str, columns: List[str], rows, chunksize: int = 50000):
+        """
+        Bulk-load an iterable of row tuples into an existing table with COPY
+        FROM STDIN, without building a DataFrame first. rows may be a
+        generator; it is consumed chunksize rows at a time. None loads as NULL.
+        Args:
+            table_name: Target table name (can include schema, e.g., 'raw.customers')
+            columns: Column names, in the order values appear in each row
+            rows: Iterable of tuples/lists
+            chunksize: Rows rendered per CSV chunk
+        """
+        def chunks():
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator='\n')
+            for i, row in enumerate(rows, 1):
+                writer.writerow(['\\N' if value is None else value for value in row])
+                if i % chunksize == 0:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate()
+            yield buf.getvalue()
+
+        self._copy_csv(table_name, columns, chunks())
+
+    def _copy_csv(self, table_name: str, columns, chunks):
+        """COPY CSV text produced by the chunks iterator into table_name and commit"""
+        if not self.conn or self.conn.closed:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')").format(
+            sql.Identifier(*table_name.split('.')),
+            sql.SQL(', ').join(map(sql.Identifier, columns))
         )
-        engine.dispose()
+        with self.conn.cursor() as cur:
+            cur.copy_expert(copy_sql, _ChunkReader(chunks))
+        self._commit()
+
+    def _commit(self):
+        """Commit now, unless a transaction() block will commit at its end"""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the block as one transaction: execute() and the COPY helpers skip
+        their per-statement commit, and the block commits once on exit or
+        rolls back if it raises. A nested block joins the outer one.
+        SET LOCAL inside the block lasts until that single commit.
+        """
+        if not self.conn or self.conn.closed:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        try:
+            yield self
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
 
     def test_connection(self) -> bool:
         """Test if connection is working"""
@@ -149,17 +404,41 @@ class PostgresConnector:
             return False
 
     def close(self):
-        """Close database connection"""
-        if self.conn and not self.conn.closed:
+        """
+        Return the connection to its pool or close it. A pooled connection is
+        rolled back and RESET ALL first, so session settings made through it
+        (search_path, SET ...) don't carry over to its next user
+        """
+        if self.conn is None:
+            return
+        if self._pool is not None:
+            discard = bool(self.conn.closed)
+            if not discard:
+                try:
+                    self.conn.rollback()
+                    with self.conn.cursor() as cur:
+                        cur.execute("RESET ALL")
+                    self.conn.commit()
+                except psycopg2.Error:
+                    # Can't vouch for its state - drop it rather than pool it
+                    discard = True
+            self._pool.putconn(self.conn, close=discard)
+        elif not self.conn.closed:
             self.conn.close()
+        self.conn = None
+        self._pool = None
 
     def __enter__(self):
-        """Context manager entry"""
-        return self.connect()
+        """Context manager entry; nested entries share one connection"""
+        self.connect()
+        self._depth += 1
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.close()
+        """Context manager exit; only the outermost exit releases the connection"""
+        self._depth -= 1
+        if self._depth == 0:
+            self.close()
 
 
 # Usage example
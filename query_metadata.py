@@ -2,13 +2,66 @@
 """
 Query metadata from TransformDash YAML files
 """
+import pickle
+import sqlite3
+import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Parsed YAML is cached on disk keyed by path + mtime; bump CACHE_VERSION
+# whenever the cached structure changes so old entries are ignored
+CACHE_VERSION = 1
+CACHE_FILE = Path(__file__).parent / '.transformdash_cache' / 'yaml_meta.sqlite'
+
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache():
+    """Open (once) the sqlite cache shared by all loader threads"""
+    global _cache_conn
+    if _cache_conn is None:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _cache_conn = sqlite3.connect(str(CACHE_FILE), check_same_thread=False)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS yaml_meta ("
+            "path TEXT PRIMARY KEY, version INTEGER, mtime INTEGER, blob BLOB)"
+        )
+    return _cache_conn
+
+
 def load_yaml(file_path):
-    """Load YAML file"""
-    with open(file_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load YAML file, reusing the cached parse when the file hasn't changed"""
+    path = str(Path(file_path).resolve())
+    mtime = Path(file_path).stat().st_mtime_ns
+
+    with _cache_lock:
+        cache = _get_cache()
+        row = cache.execute(
+            "SELECT blob FROM yaml_meta WHERE path = ? AND version = ? AND mtime = ?",
+            (path, CACHE_VERSION, mtime)
+        ).fetchone()
+    if row is not None:
+        return pickle.loads(row[0])
+
+    # Parse with the libyaml-backed loader when available
+    with open(file_path, 'rb') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    with _cache_lock:
+        cache.execute(
+            "INSERT OR REPLACE INTO yaml_meta (path, version, mtime, blob) VALUES (?, ?, ?, ?)",
+            (path, CACHE_VERSION, mtime, pickle.dumps(data))
+        )
+        cache.commit()
+
+    return data
 
 def main():
     models_dir = Path(__file__).parent / 'models'
@@ -41,11 +94,12 @@ def main():
     print("DATASETS (DBT MODELS)")
     print("=" * 80)
 
-    for yml_file in models_dir.glob('*.yml'):
-        if yml_file.name == 'dashboards.yml':
-            continue
+    # Parse all model YAML files in parallel, printing in a stable order
+    yml_files = sorted(f for f in models_dir.glob('*.yml') if f.name != 'dashboards.yml')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        parsed = list(executor.map(load_yaml, yml_files))
 
-        data = load_yaml(yml_file)
+    for yml_file, data in zip(yml_files, parsed):
 
         # Check if it's a dbt models file
         if 'models' in data:
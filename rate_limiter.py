@@ -3,27 +3,61 @@ Rate Limiting Middleware for TransformDash
 Prevents brute-force attacks and DoS by limiting request rates per IP address
 """
 import os
+import ipaddress
+import heapq
+import hmac
+import json
+import math
+import re
 import time
 import threading
-from collections import defaultdict
-from typing import Dict, Tuple, Set
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Trusted proxy IPs - only accept X-Forwarded-For from these sources
-# Configure via TRUSTED_PROXIES env var (comma-separated IPs)
-# Examples: 127.0.0.1, internal load balancer IPs, Cloudflare IPs
-TRUSTED_PROXIES: Set[str] = set(
-    filter(None, os.getenv('TRUSTED_PROXIES', '127.0.0.1,::1').split(','))
+# Configure via TRUSTED_PROXIES env var (comma-separated IPs or CIDR ranges)
+# Examples: 127.0.0.1, internal load balancer IPs, Cloudflare IP ranges
+_TRUSTED_PROXY_ENTRIES = [
+    entry.strip() for entry in os.getenv('TRUSTED_PROXIES', '127.0.0.1,::1').split(',') if entry.strip()
+]
+TRUSTED_PROXIES: FrozenSet[str] = frozenset(e for e in _TRUSTED_PROXY_ENTRIES if '/' not in e)
+TRUSTED_PROXY_NETWORKS: Tuple = tuple(
+    ipaddress.ip_network(e, strict=False) for e in _TRUSTED_PROXY_ENTRIES if '/' in e
 )
 
+# Shared secret that internal services (health checks, metrics scrapers) send
+# in X-Internal-Token to skip rate limiting; only honoured from trusted proxy
+# addresses. Unset disables the bypass
+_INTERNAL_TOKEN: Optional[bytes] = os.getenv('RATE_LIMIT_INTERNAL_TOKEN', '').encode() or None
+
+
+def _is_trusted_proxy(ip: str) -> bool:
+    """Exact-match the configured proxies first, then check CIDR ranges"""
+    if ip in TRUSTED_PROXIES:
+        return True
+    if not TRUSTED_PROXY_NETWORKS:
+        return False
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return any(addr in network for network in TRUSTED_PROXY_NETWORKS)
 
 class RateLimiter:
     """
-    Thread-safe in-memory rate limiter using sliding window algorithm.
+    Thread-safe in-memory rate limiter using a token bucket per (IP, endpoint).
+
+    Each bucket holds up to max_requests tokens and refills continuously at
+    max_requests / window_seconds tokens per second, so there is no 2x burst
+    at window boundaries as with a fixed counter.
 
     WARNING: Not suitable for distributed deployments. Request counts
     are stored in-process and not shared across multiple instances.
@@ -31,72 +65,129 @@ class RateLimiter:
     For distributed systems, use a Redis-backed rate limiter.
     """
 
+    # Number of independently locked shards (power of two)
+    SHARDS = 64
+    # Buckets untouched this long (seconds) have refilled and are dropped
+    BUCKET_TTL = 3600
+    # Most expired heap entries examined per request, so no caller pays for a backlog
+    CLEANUP_BUDGET = 32
+
     def __init__(self):
-        # Store: {ip_address: {endpoint: (request_count, window_start_time)}}
-        self.requests: Dict[str, Dict[str, Tuple[int, float]]] = defaultdict(lambda: defaultdict(lambda: (0, time.time())))
-        self.cleanup_interval = 3600  # Clean up old entries every hour
-        self.last_cleanup = time.time()
-        # Thread lock for thread-safe access
-        self._lock = threading.Lock()
-
-    def is_rate_limited(self, client_ip: str, endpoint: str, max_requests: int, window_seconds: int) -> bool:
+        # Store: {(ip_address, endpoint): [tokens, last_refill_time]}, split into
+        # shards by IP, each with its own lock so unrelated clients never contend.
+        # Plain dicts so lookups never insert; entries are mutated in place under the lock.
+        # Each shard also keeps a min-heap of (expiry_time, key) for cleanup
+        self._shards: List[Tuple[threading.Lock, Dict[Tuple[str, str], List[float]], list]] = [
+            (threading.Lock(), {}, []) for _ in range(self.SHARDS)
+        ]
+        self._shard_mask = self.SHARDS - 1
+        # Negative cache: {(ip_address, endpoint): time the bucket next has a token}.
+        # Rejected clients hit this first and are turned away with one lookup
+        self._banlist: Dict[Tuple[str, str], float] = {}
+
+    def is_rate_limited(
+        self,
+        client_ip: str,
+        endpoint: str,
+        max_requests: int,
+        window_seconds: int,
+        now: Optional[float] = None
+    ) -> bool:
         """
         Check if a request should be rate limited (thread-safe)
 
         Args:
             client_ip: Client IP address
             endpoint: API endpoint path
-            max_requests: Maximum requests allowed in the window
-            window_seconds: Time window in seconds
+            max_requests: Bucket capacity (maximum burst)
+            window_seconds: Time for an empty bucket to refill completely
+            now: time.monotonic() reading, if the caller already has one
 
         Returns:
             True if rate limited, False otherwise
         """
-        current_time = time.time()
-
-        with self._lock:
-            # Periodic cleanup
-            if current_time - self.last_cleanup > self.cleanup_interval:
-                self._cleanup_old_entries(current_time)
-
-            # Get current request count and window start time
-            count, window_start = self.requests[client_ip][endpoint]
-
-            # Reset window if expired
-            if current_time - window_start > window_seconds:
-                self.requests[client_ip][endpoint] = (1, current_time)
-                return False
-
-            # Check if limit exceeded
-            if count >= max_requests:
-                logger.warning(f"Rate limit exceeded for {client_ip} on {endpoint}: {count} requests in {current_time - window_start:.2f}s")
-                return True
-
-            # Increment counter
-            self.requests[client_ip][endpoint] = (count + 1, window_start)
-            return False
-
-    def _cleanup_old_entries(self, current_time: float):
-        """Remove entries older than 1 hour to prevent memory leak"""
-        ips_to_remove = []
-
-        for ip, endpoints in self.requests.items():
-            endpoints_to_remove = []
-            for endpoint, (count, window_start) in endpoints.items():
-                if current_time - window_start > 3600:  # 1 hour
-                    endpoints_to_remove.append(endpoint)
-
-            for endpoint in endpoints_to_remove:
-                del endpoints[endpoint]
-
-            if not endpoints:
-                ips_to_remove.append(ip)
-
-        for ip in ips_to_remove:
-            del self.requests[ip]
-
-        self.last_cleanup = current_time
-        logger.info(f"Rate limiter cleanup: removed {len(ips_to_remove)} IPs")
+        # Monotonic clock: immune to wall-clock steps, only ever compared internally
+        current_time = time.monotonic() if now is None else now
+        key = (client_ip, endpoint)
+
+        # Lock-free pre-check: a client rejected earlier is turned away until
+        # its bucket has refilled to one token. Dict reads are atomic under
+        # the GIL; anything else falls through to the authoritative path
+        ban_until = self._banlist.get(key)
+        if ban_until is not None and current_time < ban_until:
+            return True
+
+        refill_rate = max_requests / window_seconds
+        lock, requests, expiry_heap = self._shards[hash(client_ip) & self._shard_mask]
+
+        with lock:
+            entry = requests.get(key)
+
+            if entry is None:
+                # New clients start with a full bucket
+                requests[key] = [max_requests - 1.0, current_time]
+                heapq.heappush(expiry_heap, (current_time + self.BUCKET_TTL, key))
+                limited = False
+            else:
+                tokens = min(max_requests, entry[0] + (current_time - entry[1]) * refill_rate)
+                entry[1] = current_time
+
+                # Check if limit exceeded
+                if tokens < 1.0:
+                    entry[0] = tokens
+                    self._banlist[key] = current_time + (1.0 - tokens) / refill_rate
+                    limited = True
+                else:
+                    # Spend a token
+                    entry[0] = tokens - 1.0
+                    limited = False
+
+            # Incremental cleanup of this shard
+            if expiry_heap and expiry_heap[0][0] <= current_time:
+                self._cleanup_old_entries(requests, expiry_heap, current_time)
+
+        # Log outside the lock so handler I/O never delays other clients
+        if limited:
+            logger.warning(
+                "Rate limit exceeded for %s on %s: bucket of %d per %ds empty",
+                client_ip, endpoint, max_requests, window_seconds
+            )
+        return limited
+
+    def retry_after(self, client_ip: str, endpoint: str, now: Optional[float] = None) -> int:
+        """Seconds until a rejected client may retry, from the stored ban time"""
+        ban_until = self._banlist.get((client_ip, endpoint))
+        if ban_until is None:
+            return 0
+        current_time = time.monotonic() if now is None else now
+        return max(1, math.ceil(ban_until - current_time))
+
+    def _cleanup_old_entries(
+        self,
+        requests: Dict[Tuple[str, str], List[float]],
+        expiry_heap: list,
+        current_time: float
+    ):
+        """
+        Remove buckets untouched for BUCKET_TTL (refilled by then) to prevent memory leak.
+        Pops at most CLEANUP_BUDGET due heap entries; the caller holds the shard lock.
+        Heap entries are never updated in place, so a bucket touched since its
+        entry was pushed gets re-queued at its new expiry instead of deleted.
+        """
+        for _ in range(self.CLEANUP_BUDGET):
+            if not expiry_heap or expiry_heap[0][0] > current_time:
+                break
+            _, key = heapq.heappop(expiry_heap)
+            entry = requests.get(key)
+            if entry is None:
+                continue
+            expires_at = entry[1] + self.BUCKET_TTL
+            if expires_at > current_time:
+                heapq.heappush(expiry_heap, (expires_at, key))
+            else:
+                del requests[key]
+                # Any ban on the key ended long before the bucket went idle
+                self._banlist.pop(key, None)
 
 
 # Global rate limiter instance
@@ -115,25 +206,113 @@ RATE_LIMITS = {
 }
 
 
+# Exact paths resolve with one dict lookup; wildcard patterns are compiled
+# once into a single alternation whose named groups map back to their limit
+_EXACT: Dict[str, Tuple[int, int]] = {p: lim for p, lim in RATE_LIMITS.items() if "*" not in p}
+_WILDCARDS = [(p, lim) for p, lim in RATE_LIMITS.items() if "*" in p]
+_WILDCARD_LIMITS: Dict[str, Tuple[int, int]] = {f"p{i}": lim for i, (_, lim) in enumerate(_WILDCARDS)}
+_WILDCARD_RE = re.compile("|".join(
+    f"(?P<p{i}>{'.*'.join(map(re.escape, pattern.split('*')))})"
+    for i, (pattern, _) in enumerate(_WILDCARDS)
+)) if _WILDCARDS else None
+
+# Static prefix of every pattern; a path matching none of them can't be limited
+_RL_PREFIXES: Tuple[str, ...] = tuple({p.split("*", 1)[0] for p in RATE_LIMITS})
+
+
+def _reject_response(max_requests: int, window_seconds: int) -> Tuple[bytes, List[Tuple[bytes, bytes]]]:
+    """Serialized 429 body (as JSONResponse would send it) and its fixed headers"""
+    detail = {"detail": f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds."}
+    if orjson is not None:
+        body = orjson.dumps(detail)
+    else:
+        body = json.dumps(detail, separators=(",", ":")).encode()
+    return body, [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+
+# Built once per configured limit so the reject path does no serialization;
+# Retry-After is appended per rejection
+_REJECT_RESPONSES: Dict[Tuple[int, int], Tuple[bytes, List[Tuple[bytes, bytes]]]] = {
+    limit: _reject_response(*limit) for limit in set(RATE_LIMITS.values())
+}
+
+
+def _match_limit(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (max_requests, window_seconds) configured for path, if any"""
+    limit = _EXACT.get(path)
+    if limit is None and _WILDCARD_RE is not None:
+        match = _WILDCARD_RE.fullmatch(path)
+        if match:
+            limit = _WILDCARD_LIMITS[match.lastgroup]
+    return limit
+
+
+def _resolve_client_ip(direct_ip: str, forwarded: Optional[str]) -> str:
+    """Pick the client IP given the peer address and any X-Forwarded-For value"""
+    # Only trust X-Forwarded-For if request comes from a trusted proxy
+    if forwarded and _is_trusted_proxy(direct_ip):
+        # X-Forwarded-For can contain multiple IPs (client, proxy1, proxy2, ...)
+        # Take the first one (original client)
+        return forwarded.split(",")[0].strip()
+
+    # Use direct connection IP (don't trust X-Forwarded-For from untrusted sources)
+    return direct_ip
+
+
 def get_client_ip(request: Request) -> str:
     """
     Extract client IP address from request securely.
 
     Only trusts X-Forwarded-For header when the direct connection
     comes from a known/trusted proxy to prevent IP spoofing.
+    The result is memoized in the request scope.
     """
-    direct_ip = request.client.host if request.client else "unknown"
-
-    # Only trust X-Forwarded-For if request comes from a trusted proxy
-    if direct_ip in TRUSTED_PROXIES:
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            # X-Forwarded-For can contain multiple IPs (client, proxy1, proxy2, ...)
-            # Take the first one (original client)
-            return forwarded.split(",")[0].strip()
-
-    # Use direct connection IP (don't trust X-Forwarded-For from untrusted sources)
-    return direct_ip
+    scope = request.scope
+    client_ip = scope.get("_client_ip")
+    if client_ip is None:
+        direct_ip = request.client.host if request.client else "unknown"
+        client_ip = _resolve_client_ip(direct_ip, request.headers.get("X-Forwarded-For"))
+        scope["_client_ip"] = client_ip
+    return client_ip
+
+
+def _scope_client_ip(scope: dict) -> str:
+    """get_client_ip for a raw ASGI scope, without building a Request"""
+    client_ip = scope.get("_client_ip")
+    if client_ip is not None:
+        return client_ip
+
+    client = scope.get("client")
+    direct_ip = client[0] if client else "unknown"
+    forwarded = None
+    if _is_trusted_proxy(direct_ip):
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded = value.decode("latin-1")
+                break
+    client_ip = scope["_client_ip"] = _resolve_client_ip(direct_ip, forwarded)
+    return client_ip
+
+
+def _is_internal_call(scope: dict) -> bool:
+    """
+    True for service-to-service calls: a trusted proxy peer presenting the
+    internal token. Memoized in the scope as a flag for later checks.
+    """
+    internal = scope.get("_internal_service")
+    if internal is None:
+        internal = False
+        client = scope.get("client")
+        if _INTERNAL_TOKEN is not None and client and _is_trusted_proxy(client[0]):
+            for name, value in scope.get("headers", ()):
+                if name == b"x-internal-token":
+                    internal = hmac.compare_digest(value, _INTERNAL_TOKEN)
+                    break
+        scope["_internal_service"] = internal
+    return internal
 
 
 def check_rate_limit(request: Request, max_requests: int = 10, window_seconds: int = 60):
@@ -151,48 +330,59 @@ def check_rate_limit(request: Request, max_requests: int = 10, window_seconds: i
     Raises:
         HTTPException: 429 if rate limit exceeded
     """
+    if _is_internal_call(request.scope):
+        return
+
     client_ip = get_client_ip(request)
     endpoint = request.url.path
+    now = time.monotonic()
 
-    if rate_limiter.is_rate_limited(client_ip, endpoint, max_requests, window_seconds):
+    if rate_limiter.is_rate_limited(client_ip, endpoint, max_requests, window_seconds, now):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds.",
-            headers={"Retry-After": str(window_seconds)}
+            headers={"Retry-After": str(rate_limiter.retry_after(client_ip, endpoint, now))}
         )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Middleware to automatically apply rate limits to configured endpoints
+
+    Plain ASGI rather than BaseHTTPMiddleware: allowed requests go straight
+    to the wrapped app without an extra task or Request/Response wrapping,
+    and rejections are written directly with two send() calls.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        client_ip = get_client_ip(request)
-        path = request.url.path
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Non-HTTP traffic and paths outside every configured pattern's
+        # static prefix go straight through without any matching
+        if scope["type"] != "http" or not scope["path"].startswith(_RL_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # Check if this endpoint has rate limiting configured
-        for endpoint_pattern, (max_req, window) in RATE_LIMITS.items():
-            if self._matches_pattern(path, endpoint_pattern):
-                if rate_limiter.is_rate_limited(client_ip, path, max_req, window):
-                    from fastapi.responses import JSONResponse
-                    return JSONResponse(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        content={"detail": f"Rate limit exceeded. Maximum {max_req} requests per {window} seconds."},
-                        headers={"Retry-After": str(window)}
-                    )
-
-        response = await call_next(request)
-        return response
-
-    def _matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if path matches pattern (supports * wildcard)"""
-        if "*" not in pattern:
-            return path == pattern
-
-        # Simple wildcard matching
-        pattern_parts = pattern.split("*")
-        if len(pattern_parts) == 2:
-            return path.startswith(pattern_parts[0]) and path.endswith(pattern_parts[1])
+        limit = _match_limit(path)
+        if limit is not None and not _is_internal_call(scope):
+            max_req, window = limit
+            client_ip = _scope_client_ip(scope)
+            now = time.monotonic()
+            if rate_limiter.is_rate_limited(client_ip, path, max_req, window, now):
+                body, headers = _REJECT_RESPONSES[limit]
+                await send({
+                    "type": "http.response.start",
+                    "status": status.HTTP_429_TOO_MANY_REQUESTS,
+                    "headers": headers + [
+                        (b"retry-after", str(rate_limiter.retry_after(client_ip, path, now)).encode()),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self.app(scope, receive, send)
 
-        return False
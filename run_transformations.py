@@ -48,8 +48,8 @@ def run_pipeline():
         print("  Bronze (stg_*) → Silver (int_*) → Gold (fct_*)")
         raise
 
-    # Create engine and run
-    engine = TransformationEngine(models)
+    # Create engine and run, reusing the validated DAG and its execution order
+    engine = TransformationEngine(models, dag=dag)
     context = engine.run(verbose=True)
 
     # Save to history
@@ -92,7 +92,7 @@ class SchedulerService:
             job_id = f"schedule_{schedule_id}"
             models_desc = ', '.join(model_names) if len(model_names) <= 3 else f"{len(model_names)} models"
 
-            self.scheduler.add_job(
+            job = self.scheduler.add_job(
                 func=self._execute_scheduled_models,
                 trigger=trigger,
                 id=job_id,
@@ -102,8 +102,7 @@ class SchedulerService:
             )
 
             # Update next_run_at in database
-            next_run = self.scheduler.get_job(job_id).next_run_time
-            self._update_next_run_time(schedule_id, next_run)
+            self._update_next_run_time(schedule_id, job.next_run_time)
 
             logger.info(f"Added schedule {schedule_id} for {len(model_names)} model(s) with cron '{cron_expression}'")
             return True
@@ -176,12 +175,14 @@ class SchedulerService:
             logger.info(f"Starting scheduled run for models '{models_str}' (schedule {schedule_id})")
 
             # Load all models (need dependencies)
-            all_models = model_loader.load_all_models()
+            all_models = model_loader.load_all_models(cached=True)
+
+            by_name = {m.name: m for m in all_models}
 
             # Find all target models
             target_models = []
             for model_name in model_names:
-                target_model = next((m for m in all_models if m.name == model_name), None)
+                target_model = by_name.get(model_name)
                 if not target_model:
                     logger.error(f"Model '{model_name}' not found")
                     continue
@@ -190,21 +191,22 @@ class SchedulerService:
             if not target_models:
                 raise ValueError(f"No valid models found from: {model_names}")
 
-            # Get all dependencies for all target models
+            # Get all dependencies for all target models, walking each shared
+            # subtree once
+            seen = set()
             all_dependencies = []
             for target_model in target_models:
-                dependency_models = self._get_dependencies(target_model.name, all_models)
-                for dep in dependency_models:
-                    if dep not in all_dependencies:
-                        all_dependencies.append(dep)
+                all_dependencies.extend(self._get_dependencies(target_model.name, by_name, seen))
+            target_names = {m.name for m in target_models}
+            all_dependencies = [m for m in all_dependencies if m.name not in target_names]
 
             # Combine dependencies and target models
             models_to_run = all_dependencies + target_models
 
             # Create run records for each target model
-            for target_model in target_models:
-                run_id = self._create_run_record(schedule_id, target_model.name, started_at)
-                run_records[target_model.name] = run_id
+            run_records = self._create_run_records(
+                schedule_id, [m.name for m in target_models], started_at
+            )
 
             # Run all models together
             engine = TransformationEngine(models_to_run)
@@ -216,13 +218,14 @@ class SchedulerService:
             execution_time = (completed_at - started_at).total_seconds()
 
             # Update run records for each target model
+            updates = []
             for target_model in target_models:
                 run_id = run_records.get(target_model.name)
                 if not run_id:
                     continue
 
                 if target_model.status == "completed":
-                    self._complete_run_record(
+                    updates.append(self._run_record_update(
                         run_id=run_id,
                         status='completed',
                         completed_at=completed_at,
@@ -231,28 +234,30 @@ class SchedulerService:
                         models_completed=summary['successes'],
                         models_failed=summary['failures'],
                         models_skipped=0
-                    )
+                    ))
                     logger.info(f"Scheduled run completed successfully for '{target_model.name}'")
                 else:
                     error_msg = target_model.error or 'Model execution failed'
-                    self._complete_run_record(
+                    updates.append(self._run_record_update(
                         run_id=run_id,
                         status='failed',
                         completed_at=completed_at,
                         execution_time=execution_time,
                         error_message=error_msg,
                         error_traceback=None
-                    )
+                    ))
                     logger.error(f"Scheduled run failed for '{target_model.name}': {error_msg}")
 
+            self._complete_run_records(updates)
+
         except Exception as e:
             logger.error(f"Scheduled run failed: {e}")
             completed_at = datetime.now()
             execution_time = (completed_at - started_at).total_seconds()
 
             # Mark all run records as failed
-            for model_name, run_id in run_records.items():
-                self._complete_run_record(
+            self._complete_run_records([
+                self._run_record_update(
                     run_id=run_id,
                     status='failed',
                     completed_at=completed_at,
@@ -260,46 +265,65 @@ class SchedulerService:
                     error_message=str(e),
                     error_traceback=None
                 )
+                for run_id in run_records.values()
+            ])
 
         finally:
             # Update last_run_at and next_run_at for the schedule
             self._update_last_run_time(schedule_id, started_at)
-            job_id = f"schedule_{schedule_id}"
-            try:
-                next_run = self.scheduler.get_job(job_id).next_run_time
-                self._update_next_run_time(schedule_id, next_run)
-            except:
-                pass
-
-    def _get_dependencies(self, model_name: str, all_models: List) -> List:
-        """Recursively get all dependencies for a model"""
-        model = next((m for m in all_models if m.name == model_name), None)
+            # get_job returns None if the schedule was removed mid-run
+            job = self.scheduler.get_job(f"schedule_{schedule_id}")
+            if job is not None:
+                self._update_next_run_time(schedule_id, job.next_run_time)
+
+    def _get_dependencies(self, model_name: str, by_name: Dict[str, Any], seen: Optional[set] = None) -> List:
+        """
+        Get all transitive dependencies of a model, dependencies first.
+        Iterative DFS; models already in `seen` are skipped, so sharing one
+        set across several targets walks each common subtree only once.
+        """
+        if seen is None:
+            seen = set()
+        seen.add(model_name)
+
+        model = by_name.get(model_name)
         if not model:
             return []
 
         deps = []
-        for dep_name in model.depends_on:
-            deps.extend(self._get_dependencies(dep_name, all_models))
-            dep_model = next((m for m in all_models if m.name == dep_name), None)
-            if dep_model and dep_model not in deps:
-                deps.append(dep_model)
+        stack = [(model, iter(model.depends_on))]
+        while stack:
+            current, pending = stack[-1]
+            for dep_name in pending:
+                if dep_name in seen:
+                    continue
+                seen.add(dep_name)
+                dep_model = by_name.get(dep_name)
+                if dep_model:
+                    stack.append((dep_model, iter(dep_model.depends_on)))
+                    break
+            else:
+                # All of current's dependencies are emitted; emit it (post-order)
+                stack.pop()
+                if stack:
+                    deps.append(current)
 
         return deps
 
-    def _create_run_record(self, schedule_id: int, model_name: str, started_at: datetime) -> int:
-        """Create a run record in the database"""
-        with connection_manager.get_connection() as pg:
-            result = pg.execute("""
+    def _create_run_records(self, schedule_id: int, model_names: List[str], started_at: datetime) -> Dict[str, int]:
+        """Create run records for several models in one INSERT; returns {model_name: run_id}"""
+        with connection_manager.get_connection() as pg, pg.transaction():
+            rows = pg.execute_values("""
                 INSERT INTO schedule_runs (
                     schedule_id, model_name, status, started_at
                 )
-                VALUES (%s, %s, %s, %s)
-                RETURNING id
-            """, params=(schedule_id, model_name, 'running', started_at), fetch=True)
-            return result[0]['id']
+                VALUES %s
+                RETURNING id, model_name
+            """, [(schedule_id, name, 'running', started_at) for name in model_names], fetch=True)
+        return {model_name: run_id for run_id, model_name in rows}
 
-    def _complete_run_record(
-        self,
+    @staticmethod
+    def _run_record_update(
         run_id: int,
         status: str,
         completed_at: datetime,
@@ -310,27 +334,40 @@ class SchedulerService:
         models_skipped: int = 0,
         error_message: Optional[str] = None,
         error_traceback: Optional[str] = None
-    ):
-        """Update a run record with completion details"""
-        with connection_manager.get_connection() as pg:
-            pg.execute("""
+    ) -> tuple:
+        """Completion details for one run record, in _complete_run_records column order"""
+        return (
+            run_id, status, completed_at, execution_time,
+            dependencies_run, models_completed, models_failed, models_skipped,
+            error_message, error_traceback
+        )
+
+    def _complete_run_records(self, updates: List[tuple]):
+        """Update several run records with completion details in one statement"""
+        if not updates:
+            return
+        with connection_manager.get_connection() as pg, pg.transaction():
+            pg.execute_values("""
                 UPDATE schedule_runs
                 SET
-                    status = %s,
-                    completed_at = %s,
-                    execution_time_seconds = %s,
-                    dependencies_run = %s,
-                    models_completed = %s,
-                    models_failed = %s,
-                    models_skipped = %s,
-                    error_message = %s,
-                    error_traceback = %s
-                WHERE id = %s
-            """, params=(
-                status, completed_at, execution_time,
-                dependencies_run, models_completed, models_failed, models_skipped,
-                error_message, error_traceback,
-                run_id
+                    status = v.status,
+                    completed_at = v.completed_at,
+                    execution_time_seconds = v.execution_time,
+                    dependencies_run = v.dependencies_run,
+                    models_completed = v.models_completed,
+                    models_failed = v.models_failed,
+                    models_skipped = v.models_skipped,
+                    error_message = v.error_message,
+                    error_traceback = v.error_traceback
+                FROM (VALUES %s) AS v (
+                    id, status, completed_at, execution_time,
+                    dependencies_run, models_completed, models_failed, models_skipped,
+                    error_message, error_traceback
+                )
+                WHERE schedule_runs.id = v.id
+            """, updates, template=(
+                "(%s::int, %s::varchar, %s::timestamp, %s::float8,"
+                " %s::int, %s::int, %s::int, %s::int, %s::text, %s::text)"
             ))
 
     def _update_last_run_time(self, schedule_id: int, last_run_at: datetime):
@@ -355,34 +392,34 @@ class SchedulerService:
         """Load all active schedules from database and add them to scheduler"""
         try:
             with connection_manager.get_connection() as pg:
-                # Get all active schedules
+                # Get all active schedules with their models in one query
                 schedules = pg.execute("""
-                    SELECT id, schedule_name, cron_expression, timezone, is_active
-                    FROM model_schedules
-                    WHERE is_active = TRUE
-                    ORDER BY id
+                    SELECT
+                        s.id, s.schedule_name, s.cron_expression, s.timezone, s.is_active,
+                        COALESCE(
+                            array_agg(sm.model_name ORDER BY sm.model_name)
+                                FILTER (WHERE sm.model_name IS NOT NULL),
+                            '{}'
+                        ) AS model_names
+                    FROM model_schedules s
+                    LEFT JOIN schedule_models sm ON sm.schedule_id = s.id
+                    WHERE s.is_active = TRUE
+                    GROUP BY s.id
+                    ORDER BY s.id
                 """, fetch=True)
 
-                # For each schedule, get its associated models
-                for schedule in schedules:
-                    models = pg.execute("""
-                        SELECT model_name
-                        FROM schedule_models
-                        WHERE schedule_id = %s
-                        ORDER BY model_name
-                    """, params=(schedule['id'],), fetch=True)
-
-                    model_names = [m['model_name'] for m in models]
-
-                    if model_names:
-                        self.add_schedule(
-                            schedule_id=schedule['id'],
-                            model_names=model_names,
-                            cron_expression=schedule['cron_expression'],
-                            timezone=schedule['timezone']
-                        )
-                    else:
-                        logger.warning(f"Schedule {schedule['id']} has no models assigned, skipping")
+            for schedule in schedules:
+                model_names = list(schedule['model_names'])
+
+                if model_names:
+                    self.add_schedule(
+                        schedule_id=schedule['id'],
+                        model_names=model_names,
+                        cron_expression=schedule['cron_expression'],
+                        timezone=schedule['timezone']
+                    )
+                else:
+                    logger.warning(f"Schedule {schedule['id']} has no models assigned, skipping")
 
             logger.info(f"Loaded {len(schedules)} active schedules from database")
 
@@ -2,150 +2,92 @@
 Seed Fake Data - Populate PostgreSQL with realistic sample data
 Uses Faker library to generate customers, orders, products
 """
-import random
-from datetime import datetime, timedelta
-from faker import Faker
-import pandas as pd
 from postgres import PostgresConnector
-
-fake = Faker()
-Faker.seed(42)  # For reproducibility
-random.seed(42)
-
-
-def generate_customers(n=100):
-    """Generate fake customer data"""
-    customers = []
-    for i in range(1, n + 1):
-        customers.append({
-            'id': i,
-            'email': fake.email(),
-            'name': fake.name(),
-            'created_at': fake.date_time_between(start_date='-2y', end_date='now'),
-            'country': fake.country_code(),
-            'city': fake.city(),
-            'phone': fake.phone_number()
-        })
-    return pd.DataFrame(customers)
-
-
-def generate_products(n=50):
-    """Generate fake product catalog"""
-    categories = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys']
-    products = []
-    for i in range(1, n + 1):
-        products.append({
-            'id': i,
-            'name': fake.catch_phrase(),
-            'category': random.choice(categories),
-            'price': round(random.uniform(10.0, 500.0), 2),
-            'stock': random.randint(0, 1000)
-        })
-    return pd.DataFrame(products)
-
-
-def generate_orders(customers_df, products_df, n=500):
-    """Generate fake order data"""
-    orders = []
-    order_items = []
-    order_id = 1
-
-    for _ in range(n):
-        customer_id = random.choice(customers_df['id'].tolist())
-        order_date = fake.date_time_between(start_date='-1y', end_date='now')
-        num_items = random.randint(1, 5)
-
-        order_total = 0
-        for item_num in range(num_items):
-            product = products_df.sample(1).iloc[0]
-            quantity = random.randint(1, 3)
-            item_total = product['price'] * quantity
-            order_total += item_total
-
-            order_items.append({
-                'id': len(order_items) + 1,
-                'order_id': order_id,
-                'product_id': product['id'],
-                'quantity': quantity,
-                'price': product['price'],
-                'total': item_total
-            })
-
-        orders.append({
-            'id': order_id,
-            'customer_id': customer_id,
-            'order_date': order_date,
-            'total_amount': round(order_total, 2),
-            'status': random.choice(['completed', 'pending', 'cancelled'])
-        })
-        order_id += 1
-
-    return pd.DataFrame(orders), pd.DataFrame(order_items)
+from fake_generators import generate_customers, generate_products, generate_orders
 
 
 def create_raw_schema(pg):
     """Create raw schema and tables in PostgreSQL"""
     print("📦 Creating raw schema and tables...")
 
-    # Create schema
-    pg.execute("CREATE SCHEMA IF NOT EXISTS raw")
+    # One round-trip for the whole script. psycopg2 runs it inside the
+    # connection's transaction, so a failing statement rolls back all of it.
+    # Tables start UNLOGGED and without keys or constraints so COPY skips WAL
+    # and per-row index/FK checks; add_raw_constraints() restores them
+    pg.execute("""
+        CREATE SCHEMA IF NOT EXISTS raw;
 
-    # Drop existing tables
-    pg.execute("DROP TABLE IF EXISTS raw.order_items CASCADE")
-    pg.execute("DROP TABLE IF EXISTS raw.orders CASCADE")
-    pg.execute("DROP TABLE IF EXISTS raw.customers CASCADE")
-    pg.execute("DROP TABLE IF EXISTS raw.products CASCADE")
+        -- Drop existing tables
+        DROP TABLE IF EXISTS raw.order_items CASCADE;
+        DROP TABLE IF EXISTS raw.orders CASCADE;
+        DROP TABLE IF EXISTS raw.customers CASCADE;
+        DROP TABLE IF EXISTS raw.products CASCADE;
 
-    # Create customers table
-    pg.execute("""
-        CREATE TABLE raw.customers (
-            id INTEGER PRIMARY KEY,
-            email VARCHAR(255) UNIQUE,
+        CREATE UNLOGGED TABLE raw.customers (
+            id INTEGER NOT NULL,
+            email VARCHAR(255),
             name VARCHAR(255),
             created_at TIMESTAMP,
             country VARCHAR(10),
             city VARCHAR(255),
             phone VARCHAR(50)
-        )
-    """)
+        );
 
-    # Create products table
-    pg.execute("""
-        CREATE TABLE raw.products (
-            id INTEGER PRIMARY KEY,
+        CREATE UNLOGGED TABLE raw.products (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             category VARCHAR(100),
             price DECIMAL(10, 2),
             stock INTEGER
-        )
-    """)
+        );
 
-    # Create orders table
-    pg.execute("""
-        CREATE TABLE raw.orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER REFERENCES raw.customers(id),
+        CREATE UNLOGGED TABLE raw.orders (
+            id INTEGER NOT NULL,
+            customer_id INTEGER,
             order_date TIMESTAMP,
             total_amount DECIMAL(10, 2),
             status VARCHAR(50)
-        )
-    """)
+        );
 
-    # Create order_items table
-    pg.execute("""
-        CREATE TABLE raw.order_items (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
-            product_id INTEGER REFERENCES raw.products(id),
+        CREATE UNLOGGED TABLE raw.order_items (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
+            product_id INTEGER,
             quantity INTEGER,
             price DECIMAL(10, 2),
             total DECIMAL(10, 2)
-        )
+        );
     """)
 
     print("✓ Schema and tables created")
 
 
+def add_raw_constraints(pg):
+    """Make the loaded raw tables durable and add their keys and foreign keys"""
+    print("🔑 Adding keys and constraints...")
+
+    # Tables must be LOGGED before a foreign key can point at them, and each
+    # index is built once over the loaded rows instead of row by row
+    pg.execute("""
+        ALTER TABLE raw.customers SET LOGGED;
+        ALTER TABLE raw.products SET LOGGED;
+        ALTER TABLE raw.orders SET LOGGED;
+        ALTER TABLE raw.order_items SET LOGGED;
+
+        ALTER TABLE raw.customers ADD PRIMARY KEY (id), ADD UNIQUE (email);
+        ALTER TABLE raw.products ADD PRIMARY KEY (id);
+        ALTER TABLE raw.orders
+            ADD PRIMARY KEY (id),
+            ADD FOREIGN KEY (customer_id) REFERENCES raw.customers(id);
+        ALTER TABLE raw.order_items
+            ADD PRIMARY KEY (id),
+            ADD FOREIGN KEY (order_id) REFERENCES raw.orders(id),
+            ADD FOREIGN KEY (product_id) REFERENCES raw.products(id);
+    """)
+
+    print("✓ Keys and constraints added")
+
+
 def seed_data():
     """Main function to seed all fake data"""
     print("\n" + "=" * 60)
@@ -171,18 +113,26 @@ def seed_data():
 
         # Insert data
         print("\n💾 Loading data into PostgreSQL...")
+        with pg.transaction():
+            # Throwaway seed data: don't wait for a WAL flush on commit, and
+            # give the post-load index builds more memory. SET LOCAL ends with
+            # this transaction, so nothing leaks back into the pool
+            pg.execute("SET LOCAL synchronous_commit = off")
+            pg.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+            print("  → Inserting customers...")
+            pg.copy_dataframe(customers_df, 'raw.customers')
 
-        print("  → Inserting customers...")
-        pg.insert_dataframe(customers_df, 'raw.customers')
+            print("  → Inserting products...")
+            pg.copy_dataframe(products_df, 'raw.products')
 
-        print("  → Inserting products...")
-        pg.insert_dataframe(products_df, 'raw.products')
+            print("  → Inserting orders...")
+            pg.copy_dataframe(orders_df, 'raw.orders')
 
-        print("  → Inserting orders...")
-        pg.insert_dataframe(orders_df, 'raw.orders')
+            print("  → Inserting order items...")
+            pg.copy_dataframe(order_items_df, 'raw.order_items')
 
-        print("  → Inserting order items...")
-        pg.insert_dataframe(order_items_df, 'raw.order_items')
+            add_raw_constraints(pg)
 
         print("\n✅ Data loading complete!")
 
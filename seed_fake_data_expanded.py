@@ -11,15 +11,16 @@ Includes 24 tables across multiple domains:
 - Marketing: campaigns, promotions, customer_segments
 - Employees: employees, sales_reps, commissions
 """
-import random
-from datetime import datetime, timedelta
+import os
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from faker import Faker
+import numpy as np
 import pandas as pd
 from postgres import PostgresConnector
+import fake_generators
+from fake_generators import fake, rng, reseed, bothify, random_timestamps, random_dates
 
-fake = Faker()
-Faker.seed(42)  # For reproducibility
-random.seed(42)
 
 # ============================================================================
 # CORE DOMAIN - Customers, Products, Orders
@@ -27,76 +28,17 @@ random.seed(42)
 
 def generate_customers(n=100):
     """Generate fake customer data"""
-    customers = []
-    segments = ['VIP', 'Regular', 'New', 'At-Risk']
-    for i in range(1, n + 1):
-        customers.append({
-            'id': i,
-            'email': fake.email(),
-            'name': fake.name(),
-            'created_at': fake.date_time_between(start_date='-2y', end_date='now'),
-            'country': fake.country_code(),
-            'city': fake.city(),
-            'phone': fake.phone_number(),
-            'segment': random.choice(segments)
-        })
-    return pd.DataFrame(customers)
+    return fake_generators.generate_customers(n, columns='expanded')
 
 
 def generate_products(n=50):
     """Generate fake product catalog"""
-    categories = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys']
-    products = []
-    for i in range(1, n + 1):
-        products.append({
-            'id': i,
-            'name': fake.catch_phrase(),
-            'category': random.choice(categories),
-            'price': round(random.uniform(10.0, 500.0), 2),
-            'cost': round(random.uniform(5.0, 300.0), 2),
-            'sku': fake.bothify(text='??-####'),
-            'weight_kg': round(random.uniform(0.1, 10.0), 2)
-        })
-    return pd.DataFrame(products)
+    return fake_generators.generate_products(n, columns='expanded')
 
 
 def generate_orders(customers_df, products_df, n=500):
     """Generate fake order data"""
-    orders = []
-    order_items = []
-    order_id = 1
-
-    for _ in range(n):
-        customer_id = random.choice(customers_df['id'].tolist())
-        order_date = fake.date_time_between(start_date='-1y', end_date='now')
-        num_items = random.randint(1, 5)
-
-        order_total = 0
-        for item_num in range(num_items):
-            product = products_df.sample(1).iloc[0]
-            quantity = random.randint(1, 3)
-            item_total = product['price'] * quantity
-            order_total += item_total
-
-            order_items.append({
-                'id': len(order_items) + 1,
-                'order_id': order_id,
-                'product_id': product['id'],
-                'quantity': quantity,
-                'price': product['price'],
-                'total': item_total
-            })
-
-        orders.append({
-            'id': order_id,
-            'customer_id': customer_id,
-            'order_date': order_date,
-            'total_amount': round(order_total, 2),
-            'status': random.choice(['completed', 'pending', 'cancelled', 'processing'])
-        })
-        order_id += 1
-
-    return pd.DataFrame(orders), pd.DataFrame(order_items)
+    return fake_generators.generate_orders(customers_df, products_df, n, columns='expanded')
 
 
 # ============================================================================
@@ -105,51 +47,45 @@ def generate_orders(customers_df, products_df, n=500):
 
 def generate_warehouses(n=5):
     """Generate warehouse locations"""
-    warehouses = []
-    for i in range(1, n + 1):
-        warehouses.append({
-            'id': i,
-            'name': f"{fake.city()} Warehouse",
-            'location': fake.address(),
-            'capacity': random.randint(5000, 50000),
-            'manager': fake.name()
-        })
-    return pd.DataFrame(warehouses)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [f"{fake.city()} Warehouse" for _ in range(n)],
+        'location': [fake.address() for _ in range(n)],
+        'capacity': rng.integers(5000, 50001, size=n, dtype=np.int32),
+        'manager': [fake.name() for _ in range(n)]
+    })
 
 
 def generate_stock_levels(products_df, warehouses_df):
     """Generate stock levels for each product in each warehouse"""
-    stock_levels = []
-    stock_id = 1
-    for product_id in products_df['id']:
-        for warehouse_id in warehouses_df['id']:
-            stock_levels.append({
-                'id': stock_id,
-                'product_id': product_id,
-                'warehouse_id': warehouse_id,
-                'quantity': random.randint(0, 500),
-                'last_updated': fake.date_time_between(start_date='-30d', end_date='now')
-            })
-            stock_id += 1
-    return pd.DataFrame(stock_levels)
+    # Cartesian product of products x warehouses, product-major like a nested loop
+    product_ids, warehouse_ids = np.meshgrid(
+        products_df['id'].to_numpy(), warehouses_df['id'].to_numpy(), indexing='ij'
+    )
+    n = product_ids.size
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'product_id': product_ids.ravel(),
+        'warehouse_id': warehouse_ids.ravel(),
+        'quantity': rng.integers(0, 501, size=n, dtype=np.int16),
+        'last_updated': random_timestamps(-30, 0, n)
+    })
 
 
 def generate_inventory_adjustments(stock_levels_df, n=100):
     """Generate inventory adjustment records"""
-    adjustments = []
     reasons = ['Damaged', 'Lost', 'Found', 'Return', 'Correction']
-    for i in range(1, n + 1):
-        stock = stock_levels_df.sample(1).iloc[0]
-        adjustments.append({
-            'id': i,
-            'product_id': stock['product_id'],
-            'warehouse_id': stock['warehouse_id'],
-            'adjustment_qty': random.randint(-50, 50),
-            'reason': random.choice(reasons),
-            'adjustment_date': fake.date_time_between(start_date='-6m', end_date='now'),
-            'notes': fake.sentence()
-        })
-    return pd.DataFrame(adjustments)
+    # Pick n stock rows in one draw and gather their columns
+    idx = rng.integers(0, len(stock_levels_df), size=n)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'product_id': stock_levels_df['product_id'].to_numpy()[idx],
+        'warehouse_id': stock_levels_df['warehouse_id'].to_numpy()[idx],
+        'adjustment_qty': rng.integers(-50, 51, size=n, dtype=np.int16),
+        'reason': pd.Categorical(rng.choice(reasons, size=n), categories=reasons),
+        'adjustment_date': random_timestamps(-182, 0, n),
+        'notes': fake.sentences(nb=n)
+    })
 
 
 # ============================================================================
@@ -158,76 +94,70 @@ def generate_inventory_adjustments(stock_levels_df, n=100):
 
 def generate_suppliers(n=15):
     """Generate supplier data"""
-    suppliers = []
-    for i in range(1, n + 1):
-        suppliers.append({
-            'id': i,
-            'name': fake.company(),
-            'contact_name': fake.name(),
-            'email': fake.company_email(),
-            'phone': fake.phone_number(),
-            'country': fake.country(),
-            'rating': round(random.uniform(3.0, 5.0), 1)
-        })
-    return pd.DataFrame(suppliers)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [fake.company() for _ in range(n)],
+        'contact_name': [fake.name() for _ in range(n)],
+        'email': [fake.company_email() for _ in range(n)],
+        'phone': [fake.phone_number() for _ in range(n)],
+        'country': [fake.country() for _ in range(n)],
+        'rating': rng.uniform(3.0, 5.0, size=n).round(1).astype(np.float32)
+    })
 
 
 def generate_purchase_orders(suppliers_df, products_df, n=200):
     """Generate purchase orders from suppliers"""
-    purchase_orders = []
-    po_items = []
-    po_id = 1
-
-    for _ in range(n):
-        supplier_id = random.choice(suppliers_df['id'].tolist())
-        po_date = fake.date_time_between(start_date='-1y', end_date='now')
-        expected_delivery = po_date + timedelta(days=random.randint(7, 30))
-        num_items = random.randint(1, 5)
-
-        po_total = 0
-        for _ in range(num_items):
-            product = products_df.sample(1).iloc[0]
-            quantity = random.randint(50, 500)
-            unit_cost = product['cost']
-            total = quantity * unit_cost
-            po_total += total
-
-            po_items.append({
-                'id': len(po_items) + 1,
-                'purchase_order_id': po_id,
-                'product_id': product['id'],
-                'quantity': quantity,
-                'unit_cost': unit_cost,
-                'total': round(total, 2)
-            })
-
-        purchase_orders.append({
-            'id': po_id,
-            'supplier_id': supplier_id,
-            'order_date': po_date,
-            'expected_delivery': expected_delivery,
-            'status': random.choice(['pending', 'received', 'cancelled']),
-            'total_amount': round(po_total, 2)
-        })
-        po_id += 1
-
-    return pd.DataFrame(purchase_orders), pd.DataFrame(po_items)
+    # Pre-draw item counts, products and quantities and build both tables
+    # column-wise (see generate_orders)
+    product_ids = products_df['id'].to_numpy()
+    costs = products_df['cost'].to_numpy()
+    num_items_per_po = rng.integers(1, 6, size=n)
+    total_items = int(num_items_per_po.sum())
+    product_idx = rng.integers(0, len(products_df), size=total_items)
+    quantities = rng.integers(50, 501, size=total_items, dtype=np.int16)
+
+    po_ids = np.arange(1, n + 1, dtype=np.int32)
+    unit_costs = costs[product_idx]
+    item_totals = quantities * unit_costs.astype(np.float64)
+    po_items = pd.DataFrame({
+        'id': np.arange(1, total_items + 1, dtype=np.int32),
+        'purchase_order_id': np.repeat(po_ids, num_items_per_po),
+        'product_id': product_ids[product_idx],
+        'quantity': quantities,
+        'unit_cost': unit_costs,
+        'total': item_totals.round(2)
+    })
+    po_totals = np.bincount(
+        np.repeat(np.arange(n), num_items_per_po), weights=item_totals, minlength=n
+    )
+
+    po_dates = random_timestamps(-365, 0, n)
+    purchase_orders = pd.DataFrame({
+        'id': po_ids,
+        'supplier_id': rng.choice(suppliers_df['id'].to_numpy(), size=n),
+        'order_date': po_dates,
+        'expected_delivery': po_dates + rng.integers(7, 31, size=n).astype('timedelta64[D]'),
+        'status': rng.choice(['pending', 'received', 'cancelled'], size=n),
+        'total_amount': po_totals.round(2)
+    })
+    return purchase_orders, po_items
 
 
 def generate_supplier_payments(purchase_orders_df, n=150):
     """Generate supplier payment records"""
-    payments = []
-    for i in range(1, n + 1):
-        po = purchase_orders_df.sample(1).iloc[0]
-        payments.append({
-            'id': i,
-            'purchase_order_id': po['id'],
-            'payment_date': po['order_date'] + timedelta(days=random.randint(30, 90)),
-            'amount': round(po['total_amount'] * random.uniform(0.8, 1.0), 2),
-            'payment_method': random.choice(['Bank Transfer', 'Check', 'Wire']),
-            'status': random.choice(['paid', 'pending', 'overdue'])
-        })
-    return pd.DataFrame(payments)
+    po_idx = rng.integers(0, len(purchase_orders_df), size=n)
+    po_totals = purchase_orders_df['total_amount'].to_numpy()[po_idx]
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'purchase_order_id': purchase_orders_df['id'].to_numpy()[po_idx],
+        'payment_date': (
+            purchase_orders_df['order_date'].to_numpy()[po_idx]
+            + rng.integers(30, 91, size=n).astype('timedelta64[D]')
+        ),
+        'amount': (po_totals * rng.uniform(0.8, 1.0, size=n)).round(2),
+        'payment_method': rng.choice(['Bank Transfer', 'Check', 'Wire'], size=n),
+        'status': rng.choice(['paid', 'pending', 'overdue'], size=n)
+    })
 
 
 # ============================================================================
@@ -237,55 +167,46 @@ def generate_supplier_payments(purchase_orders_df, n=150):
 def generate_carriers(n=5):
     """Generate shipping carrier data"""
     carrier_names = ['FedEx', 'UPS', 'DHL', 'USPS', 'Amazon Logistics']
-    carriers = []
-    for i in range(1, n + 1):
-        carriers.append({
-            'id': i,
-            'name': carrier_names[i-1] if i <= len(carrier_names) else fake.company(),
-            'contact_phone': fake.phone_number(),
-            'rating': round(random.uniform(3.5, 5.0), 1)
-        })
-    return pd.DataFrame(carriers)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [carrier_names[i] if i < len(carrier_names) else fake.company() for i in range(n)],
+        'contact_phone': [fake.phone_number() for _ in range(n)],
+        'rating': rng.uniform(3.5, 5.0, size=n).round(1).astype(np.float32)
+    })
 
 
 def generate_shipments(orders_df, carriers_df, warehouses_df):
     """Generate shipment records for completed orders"""
     completed_orders = orders_df[orders_df['status'] == 'completed']
-    shipments = []
-
-    for idx, order in completed_orders.iterrows():
-        shipments.append({
-            'id': len(shipments) + 1,
-            'order_id': order['id'],
-            'carrier_id': random.choice(carriers_df['id'].tolist()),
-            'warehouse_id': random.choice(warehouses_df['id'].tolist()),
-            'tracking_number': fake.bothify(text='??###########'),
-            'ship_date': order['order_date'] + timedelta(days=random.randint(1, 3)),
-            'estimated_delivery': order['order_date'] + timedelta(days=random.randint(5, 10)),
-            'actual_delivery': order['order_date'] + timedelta(days=random.randint(4, 12)),
-            'status': random.choice(['in_transit', 'delivered', 'delayed'])
-        })
-
-    return pd.DataFrame(shipments)
+    n = len(completed_orders)
+    order_dates = completed_orders['order_date'].to_numpy()
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'order_id': completed_orders['id'].to_numpy(),
+        'carrier_id': rng.choice(carriers_df['id'].to_numpy(), size=n),
+        'warehouse_id': rng.choice(warehouses_df['id'].to_numpy(), size=n),
+        'tracking_number': bothify('??###########', n),
+        'ship_date': order_dates + rng.integers(1, 4, size=n).astype('timedelta64[D]'),
+        'estimated_delivery': order_dates + rng.integers(5, 11, size=n).astype('timedelta64[D]'),
+        'actual_delivery': order_dates + rng.integers(4, 13, size=n).astype('timedelta64[D]'),
+        'status': rng.choice(['in_transit', 'delivered', 'delayed'], size=n)
+    })
 
 
 def generate_tracking_events(shipments_df, n=300):
     """Generate tracking events for shipments"""
-    events = []
     event_types = ['Picked Up', 'In Transit', 'Out for Delivery', 'Delivered', 'Exception']
-
-    for i in range(1, n + 1):
-        shipment = shipments_df.sample(1).iloc[0]
-        events.append({
-            'id': i,
-            'shipment_id': shipment['id'],
-            'event_type': random.choice(event_types),
-            'location': fake.city(),
-            'event_date': shipment['ship_date'] + timedelta(days=random.randint(0, 7)),
-            'notes': fake.sentence()
-        })
-
-    return pd.DataFrame(events)
+    # Pick n shipments in one draw and gather their columns
+    idx = rng.integers(0, len(shipments_df), size=n)
+    ship_dates = shipments_df['ship_date'].to_numpy()[idx]
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'shipment_id': shipments_df['id'].to_numpy()[idx],
+        'event_type': pd.Categorical(rng.choice(event_types, size=n), categories=event_types),
+        'location': [fake.city() for _ in range(n)],
+        'event_date': ship_dates + rng.integers(0, 8, size=n).astype('timedelta64[D]'),
+        'notes': fake.sentences(nb=n)
+    })
 
 
 # ============================================================================
@@ -294,72 +215,71 @@ def generate_tracking_events(shipments_df, n=300):
 
 def generate_returns(orders_df, n=50):
     """Generate return records"""
-    returns = []
     return_reasons = ['Defective', 'Wrong Item', 'Not as Described', 'Changed Mind', 'Size Issue']
-
-    for i in range(1, n + 1):
-        order = orders_df.sample(1).iloc[0]
-        returns.append({
-            'id': i,
-            'order_id': order['id'],
-            'return_date': order['order_date'] + timedelta(days=random.randint(5, 30)),
-            'reason': random.choice(return_reasons),
-            'status': random.choice(['pending', 'approved', 'rejected', 'completed']),
-            'notes': fake.sentence()
-        })
-
-    return pd.DataFrame(returns)
+    order_idx = rng.integers(0, len(orders_df), size=n)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'order_id': orders_df['id'].to_numpy()[order_idx],
+        'return_date': (
+            orders_df['order_date'].to_numpy()[order_idx]
+            + rng.integers(5, 31, size=n).astype('timedelta64[D]')
+        ),
+        'reason': rng.choice(return_reasons, size=n),
+        'status': rng.choice(['pending', 'approved', 'rejected', 'completed'], size=n),
+        'notes': fake.sentences(nb=n)
+    })
 
 
 def generate_return_items(returns_df, order_items_df):
     """Generate return item details"""
-    return_items = []
-    item_id = 1
-
-    for _, return_record in returns_df.iterrows():
-        # Get items from the original order
-        order_items = order_items_df[order_items_df['order_id'] == return_record['order_id']]
-        if len(order_items) > 0:
-            # Return 1-3 items from the order
-            num_items = min(random.randint(1, 3), len(order_items))
-            items_to_return = order_items.sample(num_items)
-
-            for _, item in items_to_return.iterrows():
-                item_qty = int(item['quantity'])
-                return_qty = random.randint(1, max(1, item_qty))
-                return_items.append({
-                    'id': item_id,
-                    'return_id': return_record['id'],
-                    'order_item_id': int(item['id']),
-                    'product_id': int(item['product_id']),
-                    'quantity': return_qty,
-                    'refund_amount': round(float(item['price']) * return_qty, 2)
-                })
-                item_id += 1
-
-    return pd.DataFrame(return_items)
+    # Each return takes 1-3 distinct items from its original order. Every
+    # (return, item of its order) pair gets a random key and the num_items
+    # lowest keys per return are kept: sampling without replacement for all
+    # returns in one pass. Items are located by binary search over order_id
+    order_sort = np.argsort(order_items_df['order_id'].to_numpy(), kind='stable')
+    sorted_order_ids = order_items_df['order_id'].to_numpy()[order_sort]
+    return_order_ids = returns_df['order_id'].to_numpy()
+    first = np.searchsorted(sorted_order_ids, return_order_ids, side='left')
+    items_per_return = np.searchsorted(sorted_order_ids, return_order_ids, side='right') - first
+    num_items = np.minimum(rng.integers(1, 4, size=len(returns_df)), items_per_return)
+
+    pair_return = np.repeat(np.arange(len(returns_df)), items_per_return)
+    pair_start = np.repeat(np.cumsum(items_per_return) - items_per_return, items_per_return)
+    pair_item = order_sort[np.repeat(first, items_per_return) + np.arange(len(pair_return)) - pair_start]
+    shuffled = np.lexsort((rng.random(len(pair_return)), pair_return))
+    keep = shuffled[np.arange(len(shuffled)) - pair_start < num_items[pair_return]]
+    return_idx, item_idx = pair_return[keep], pair_item[keep]
+
+    n = len(item_idx)
+    item_quantities = order_items_df['quantity'].to_numpy()[item_idx].astype(np.int64)
+    return_qty = rng.integers(1, np.maximum(1, item_quantities) + 1)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'return_id': returns_df['id'].to_numpy()[return_idx],
+        'order_item_id': order_items_df['id'].to_numpy()[item_idx],
+        'product_id': order_items_df['product_id'].to_numpy()[item_idx],
+        'quantity': return_qty,
+        'refund_amount': (order_items_df['price'].to_numpy()[item_idx] * return_qty).round(2)
+    })
 
 
 def generate_refund_transactions(returns_df, return_items_df):
     """Generate refund transaction records"""
-    refunds = []
-
-    for _, return_record in returns_df.iterrows():
-        if return_record['status'] in ['approved', 'completed']:
-            # Calculate total refund from return items
-            return_items = return_items_df[return_items_df['return_id'] == return_record['id']]
-            total_refund = return_items['refund_amount'].sum()
-
-            refunds.append({
-                'id': len(refunds) + 1,
-                'return_id': return_record['id'],
-                'refund_date': return_record['return_date'] + timedelta(days=random.randint(1, 7)),
-                'amount': round(total_refund, 2),
-                'method': random.choice(['Original Payment', 'Store Credit', 'Check']),
-                'status': random.choice(['processed', 'pending'])
-            })
-
-    return pd.DataFrame(refunds)
+    refunded = returns_df[returns_df['status'].isin(['approved', 'completed'])]
+    n = len(refunded)
+    # Total refund per return, from its return items
+    refund_totals = return_items_df.groupby('return_id')['refund_amount'].sum()
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'return_id': refunded['id'].to_numpy(),
+        'refund_date': (
+            refunded['return_date'].to_numpy()
+            + rng.integers(1, 8, size=n).astype('timedelta64[D]')
+        ),
+        'amount': refunded['id'].map(refund_totals).fillna(0.0).round(2).to_numpy(),
+        'method': rng.choice(['Original Payment', 'Store Credit', 'Check'], size=n),
+        'status': rng.choice(['processed', 'pending'], size=n)
+    })
 
 
 # ============================================================================
@@ -368,47 +288,47 @@ def generate_refund_transactions(returns_df, return_items_df):
 
 def generate_payment_methods(customers_df):
     """Generate customer payment methods"""
-    payment_methods = []
-    method_id = 1
-
-    for customer_id in customers_df['id']:
-        # Each customer has 1-3 payment methods
-        num_methods = random.randint(1, 3)
-        for _ in range(num_methods):
-            payment_methods.append({
-                'id': method_id,
-                'customer_id': customer_id,
-                'type': random.choice(['Credit Card', 'Debit Card', 'PayPal', 'Bank Account']),
-                'last_four': fake.bothify(text='####'),
-                'expiry_date': fake.date_between(start_date='today', end_date='+3y'),
-                'is_default': (_ == 0)  # First one is default
-            })
-            method_id += 1
-
-    return pd.DataFrame(payment_methods)
+    # Each customer has 1-3 payment methods; the first one is their default
+    methods_per_customer = rng.integers(1, 4, size=len(customers_df))
+    n = int(methods_per_customer.sum())
+    first_of_customer = np.repeat(np.cumsum(methods_per_customer) - methods_per_customer, methods_per_customer)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'customer_id': np.repeat(customers_df['id'].to_numpy(), methods_per_customer),
+        'type': rng.choice(['Credit Card', 'Debit Card', 'PayPal', 'Bank Account'], size=n),
+        'last_four': bothify('####', n),
+        'expiry_date': random_dates(0, 1095, n),
+        'is_default': np.arange(n) == first_of_customer
+    })
 
 
 def generate_payment_transactions(orders_df, payment_methods_df):
     """Generate payment transaction records"""
-    transactions = []
-
-    for _, order in orders_df.iterrows():
-        if order['status'] in ['completed', 'processing']:
-            # Find a payment method for this customer
-            customer_methods = payment_methods_df[payment_methods_df['customer_id'] == order['customer_id']]
-            if len(customer_methods) > 0:
-                method = customer_methods.sample(1).iloc[0]
-                transactions.append({
-                    'id': len(transactions) + 1,
-                    'order_id': order['id'],
-                    'payment_method_id': method['id'],
-                    'transaction_date': order['order_date'],
-                    'amount': order['total_amount'],
-                    'status': random.choice(['success', 'pending', 'failed']),
-                    'transaction_id': fake.bothify(text='TXN-##########')
-                })
-
-    return pd.DataFrame(transactions)
+    paid_orders = orders_df[orders_df['status'].isin(['completed', 'processing'])]
+
+    # Pay each order with one of its customer's payment methods, located by
+    # binary search over the methods sorted by customer. Orders whose
+    # customer has none are skipped
+    method_sort = np.argsort(payment_methods_df['customer_id'].to_numpy(), kind='stable')
+    sorted_customer_ids = payment_methods_df['customer_id'].to_numpy()[method_sort]
+    customer_ids = paid_orders['customer_id'].to_numpy()
+    first = np.searchsorted(sorted_customer_ids, customer_ids, side='left')
+    methods_per_order = np.searchsorted(sorted_customer_ids, customer_ids, side='right') - first
+    has_method = methods_per_order > 0
+
+    n = int(has_method.sum())
+    picked = method_sort[
+        first[has_method] + (rng.random(n) * methods_per_order[has_method]).astype(np.int64)
+    ]
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'order_id': paid_orders['id'].to_numpy()[has_method],
+        'payment_method_id': payment_methods_df['id'].to_numpy()[picked],
+        'transaction_date': paid_orders['order_date'].to_numpy()[has_method],
+        'amount': paid_orders['total_amount'].to_numpy()[has_method],
+        'status': rng.choice(['success', 'pending', 'failed'], size=n),
+        'transaction_id': bothify('TXN-##########', n)
+    })
 
 
 # ============================================================================
@@ -417,67 +337,63 @@ def generate_payment_transactions(orders_df, payment_methods_df):
 
 def generate_campaigns(n=10):
     """Generate marketing campaign data"""
-    campaigns = []
     channels = ['Email', 'Social Media', 'SMS', 'Display Ads', 'Search']
-
-    for i in range(1, n + 1):
-        start_date = fake.date_between(start_date='-1y', end_date='now')
-        campaigns.append({
-            'id': i,
-            'name': fake.catch_phrase(),
-            'channel': random.choice(channels),
-            'start_date': start_date,
-            'end_date': start_date + timedelta(days=random.randint(7, 60)),
-            'budget': round(random.uniform(1000, 50000), 2),
-            'status': random.choice(['active', 'completed', 'paused'])
-        })
-
-    return pd.DataFrame(campaigns)
+    start_dates = random_dates(-365, 0, n)
+    durations = rng.integers(7, 61, size=n).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [fake.catch_phrase() for _ in range(n)],
+        'channel': rng.choice(channels, size=n),
+        'start_date': start_dates,
+        'end_date': start_dates + durations,
+        'budget': rng.uniform(1000, 50000, size=n).round(2),
+        'status': rng.choice(['active', 'completed', 'paused'], size=n)
+    })
 
 
 def generate_promotions(n=20):
     """Generate promotion/discount data"""
-    promotions = []
     promo_types = ['Percentage', 'Fixed Amount', 'BOGO', 'Free Shipping']
-
-    for i in range(1, n + 1):
-        start_date = fake.date_between(start_date='-6m', end_date='now')
-        promotions.append({
-            'id': i,
-            'code': fake.bothify(text='????##'),
-            'type': random.choice(promo_types),
-            'discount_value': round(random.uniform(5, 50), 2),
-            'start_date': start_date,
-            'end_date': start_date + timedelta(days=random.randint(7, 90)),
-            'usage_limit': random.randint(100, 10000),
-            'times_used': random.randint(0, 500)
-        })
-
-    return pd.DataFrame(promotions)
+    start_dates = random_dates(-182, 0, n)
+    durations = rng.integers(7, 91, size=n).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'code': bothify('????##', n),
+        'type': rng.choice(promo_types, size=n),
+        'discount_value': rng.uniform(5, 50, size=n).round(2),
+        'start_date': start_dates,
+        'end_date': start_dates + durations,
+        'usage_limit': rng.integers(100, 10001, size=n, dtype=np.int32),
+        'times_used': rng.integers(0, 501, size=n, dtype=np.int16)
+    })
 
 
 def generate_customer_segments(customers_df):
     """Generate customer segment mapping"""
-    segments = []
-    segment_id = 1
-
-    segment_names = ['High Value', 'Frequent Buyer', 'New Customer', 'At Risk', 'Dormant']
-
-    for customer_id in customers_df['id']:
-        # Assign customer to 1-2 segments
-        num_segments = random.randint(1, 2)
-        chosen_segments = random.sample(segment_names, num_segments)
-
-        for segment_name in chosen_segments:
-            segments.append({
-                'id': segment_id,
-                'customer_id': customer_id,
-                'segment_name': segment_name,
-                'assigned_date': fake.date_between(start_date='-1y', end_date='now')
-            })
-            segment_id += 1
-
-    return pd.DataFrame(segments)
+    segment_names = np.array(['High Value', 'Frequent Buyer', 'New Customer', 'At Risk', 'Dormant'])
+    num_customers = len(customers_df)
+
+    # Assign each customer to 1-2 segments. The second is a nonzero step
+    # (mod the number of segments) from the first, so the two always differ
+    # and the second is uniform over the remaining segments
+    segments_per_customer = rng.integers(1, 3, size=num_customers)
+    first_segment = rng.integers(0, len(segment_names), size=num_customers)
+    step = rng.integers(1, len(segment_names), size=num_customers)
+
+    n = int(segments_per_customer.sum())
+    position = np.arange(n) - np.repeat(
+        np.cumsum(segments_per_customer) - segments_per_customer, segments_per_customer
+    )
+    segment_idx = (
+        np.repeat(first_segment, segments_per_customer)
+        + position * np.repeat(step, segments_per_customer)
+    ) % len(segment_names)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'customer_id': np.repeat(customers_df['id'].to_numpy(), segments_per_customer),
+        'segment_name': segment_names[segment_idx],
+        'assigned_date': random_dates(-365, 0, n)
+    })
 
 
 # ============================================================================
@@ -486,21 +402,16 @@ def generate_customer_segments(customers_df):
 
 def generate_employees(n=25):
     """Generate employee data"""
-    employees = []
     departments = ['Sales', 'Marketing', 'Operations', 'Customer Service', 'IT']
-
-    for i in range(1, n + 1):
-        employees.append({
-            'id': i,
-            'name': fake.name(),
-            'email': fake.company_email(),
-            'department': random.choice(departments),
-            'position': fake.job(),
-            'hire_date': fake.date_between(start_date='-5y', end_date='-1m'),
-            'salary': round(random.uniform(40000, 120000), 2)
-        })
-
-    return pd.DataFrame(employees)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'name': [fake.name() for _ in range(n)],
+        'email': [fake.company_email() for _ in range(n)],
+        'department': rng.choice(departments, size=n),
+        'position': [fake.job() for _ in range(n)],
+        'hire_date': random_dates(-1825, -30, n),
+        'salary': rng.uniform(40000, 120000, size=n).round(2)
+    })
 
 
 def generate_sales_reps(employees_df):
@@ -511,62 +422,89 @@ def generate_sales_reps(employees_df):
 
 def generate_commissions(orders_df, sales_reps_df):
     """Generate commission records for sales"""
-    commissions = []
+    completed_orders = orders_df[orders_df['status'] == 'completed']
+    rep_ids = sales_reps_df['sales_rep_id'].to_numpy()
+    if len(rep_ids) == 0:
+        completed_orders = completed_orders.iloc[:0]
+    n = len(completed_orders)
 
     # Assign random sales rep to each completed order
-    for _, order in orders_df[orders_df['status'] == 'completed'].iterrows():
-        if len(sales_reps_df) > 0:
-            sales_rep = sales_reps_df.sample(1).iloc[0]
-            commission_rate = random.uniform(0.03, 0.08)
-            commission_amount = order['total_amount'] * commission_rate
-
-            commissions.append({
-                'id': len(commissions) + 1,
-                'order_id': order['id'],
-                'sales_rep_id': sales_rep['sales_rep_id'],
-                'commission_rate': round(commission_rate, 4),
-                'commission_amount': round(commission_amount, 2),
-                'paid_date': order['order_date'] + timedelta(days=random.randint(30, 60)),
-                'status': random.choice(['paid', 'pending'])
-            })
-
-    return pd.DataFrame(commissions)
+    rates = rng.uniform(0.03, 0.08, size=n)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=np.int32),
+        'order_id': completed_orders['id'].to_numpy(),
+        'sales_rep_id': rep_ids[rng.integers(0, max(len(rep_ids), 1), size=n)],
+        'commission_rate': rates.round(4),
+        'commission_amount': (completed_orders['total_amount'].to_numpy() * rates).round(2),
+        'paid_date': (
+            completed_orders['order_date'].to_numpy()
+            + rng.integers(30, 61, size=n).astype('timedelta64[D]')
+        ),
+        'status': rng.choice(['paid', 'pending'], size=n)
+    })
 
 
 # ============================================================================
 # DATABASE SCHEMA CREATION
 # ============================================================================
 
-def create_expanded_schema(pg):
-    """Create all schemas and tables for expanded dataset"""
-    print("📦 Creating raw schema and all tables...")
-
-    # Create schema
-    pg.execute("CREATE SCHEMA IF NOT EXISTS raw")
-
-    # Drop all tables in reverse dependency order
-    print("  → Dropping existing tables...")
-    tables_to_drop = [
-        'commissions', 'sales_reps', 'employees',
-        'customer_segments', 'promotions', 'campaigns',
-        'payment_transactions', 'payment_methods',
-        'refund_transactions', 'return_items', 'returns',
-        'tracking_events', 'shipments', 'carriers',
-        'supplier_payments', 'purchase_order_items', 'purchase_orders', 'suppliers',
-        'inventory_adjustments', 'stock_levels', 'warehouses',
-        'order_items', 'orders', 'customers', 'products'
-    ]
-
-    for table in tables_to_drop:
-        pg.execute(f"DROP TABLE IF EXISTS raw.{table} CASCADE")
-
-    print("  → Creating core tables...")
-
+# Every raw table in dependency order, with its primary key column
+TABLES = {
+    'customers': 'id', 'products': 'id', 'orders': 'id', 'order_items': 'id',
+    'warehouses': 'id', 'stock_levels': 'id', 'inventory_adjustments': 'id',
+    'suppliers': 'id', 'purchase_orders': 'id', 'purchase_order_items': 'id',
+    'supplier_payments': 'id',
+    'carriers': 'id', 'shipments': 'id', 'tracking_events': 'id',
+    'returns': 'id', 'return_items': 'id', 'refund_transactions': 'id',
+    'payment_methods': 'id', 'payment_transactions': 'id',
+    'campaigns': 'id', 'promotions': 'id', 'customer_segments': 'id',
+    'employees': 'id', 'sales_reps': 'sales_rep_id', 'commissions': 'id',
+}
+
+# Foreign keys as (table, column, referenced table, referenced column). Like
+# the primary keys, they are added by add_constraints() once the data is
+# loaded, not declared in the CREATE TABLEs, so COPY never maintains an index
+# or runs a referential check per row
+FOREIGN_KEYS = [
+    ('orders', 'customer_id', 'customers', 'id'),
+    ('order_items', 'order_id', 'orders', 'id'),
+    ('order_items', 'product_id', 'products', 'id'),
+    ('stock_levels', 'product_id', 'products', 'id'),
+    ('stock_levels', 'warehouse_id', 'warehouses', 'id'),
+    ('inventory_adjustments', 'product_id', 'products', 'id'),
+    ('inventory_adjustments', 'warehouse_id', 'warehouses', 'id'),
+    ('purchase_orders', 'supplier_id', 'suppliers', 'id'),
+    ('purchase_order_items', 'purchase_order_id', 'purchase_orders', 'id'),
+    ('purchase_order_items', 'product_id', 'products', 'id'),
+    ('supplier_payments', 'purchase_order_id', 'purchase_orders', 'id'),
+    ('shipments', 'order_id', 'orders', 'id'),
+    ('shipments', 'carrier_id', 'carriers', 'id'),
+    ('shipments', 'warehouse_id', 'warehouses', 'id'),
+    ('tracking_events', 'shipment_id', 'shipments', 'id'),
+    ('returns', 'order_id', 'orders', 'id'),
+    ('return_items', 'return_id', 'returns', 'id'),
+    ('return_items', 'order_item_id', 'order_items', 'id'),
+    ('return_items', 'product_id', 'products', 'id'),
+    ('refund_transactions', 'return_id', 'returns', 'id'),
+    ('payment_methods', 'customer_id', 'customers', 'id'),
+    ('payment_transactions', 'order_id', 'orders', 'id'),
+    ('payment_transactions', 'payment_method_id', 'payment_methods', 'id'),
+    ('customer_segments', 'customer_id', 'customers', 'id'),
+    ('sales_reps', 'sales_rep_id', 'employees', 'id'),
+    ('commissions', 'order_id', 'orders', 'id'),
+    ('commissions', 'sales_rep_id', 'sales_reps', 'sales_rep_id'),
+]
+
+
+# CREATE TABLE statements in dependency order. Tables start UNLOGGED and
+# without keys so COPY skips WAL and index maintenance; add_constraints()
+# restores both
+_CREATE_TABLES = (
     # Core tables
-    pg.execute("""
-        CREATE TABLE raw.customers (
-            id INTEGER PRIMARY KEY,
-            email VARCHAR(255) UNIQUE,
+    """
+        CREATE UNLOGGED TABLE raw.customers (
+            id INTEGER NOT NULL,
+            email VARCHAR(255),
             name VARCHAR(255),
             created_at TIMESTAMP,
             country VARCHAR(10),
@@ -574,11 +512,11 @@ def create_expanded_schema(pg):
             phone VARCHAR(50),
             segment VARCHAR(50)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.products (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.products (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             category VARCHAR(100),
             price DECIMAL(10, 2),
@@ -586,70 +524,66 @@ def create_expanded_schema(pg):
             sku VARCHAR(50),
             weight_kg DECIMAL(10, 2)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER REFERENCES raw.customers(id),
+    """
+        CREATE UNLOGGED TABLE raw.orders (
+            id INTEGER NOT NULL,
+            customer_id INTEGER,
             order_date TIMESTAMP,
             total_amount DECIMAL(10, 2),
             status VARCHAR(50)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.order_items (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
-            product_id INTEGER REFERENCES raw.products(id),
+    """
+        CREATE UNLOGGED TABLE raw.order_items (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
+            product_id INTEGER,
             quantity INTEGER,
             price DECIMAL(10, 2),
             total DECIMAL(10, 2)
         )
-    """)
-
-    print("  → Creating inventory tables...")
+    """,
 
     # Inventory tables
-    pg.execute("""
-        CREATE TABLE raw.warehouses (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.warehouses (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             location TEXT,
             capacity INTEGER,
             manager VARCHAR(255)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.stock_levels (
-            id INTEGER PRIMARY KEY,
-            product_id INTEGER REFERENCES raw.products(id),
-            warehouse_id INTEGER REFERENCES raw.warehouses(id),
+    """
+        CREATE UNLOGGED TABLE raw.stock_levels (
+            id INTEGER NOT NULL,
+            product_id INTEGER,
+            warehouse_id INTEGER,
             quantity INTEGER,
             last_updated TIMESTAMP
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.inventory_adjustments (
-            id INTEGER PRIMARY KEY,
-            product_id INTEGER REFERENCES raw.products(id),
-            warehouse_id INTEGER REFERENCES raw.warehouses(id),
+    """
+        CREATE UNLOGGED TABLE raw.inventory_adjustments (
+            id INTEGER NOT NULL,
+            product_id INTEGER,
+            warehouse_id INTEGER,
             adjustment_qty INTEGER,
             reason VARCHAR(100),
             adjustment_date TIMESTAMP,
             notes TEXT
         )
-    """)
-
-    print("  → Creating supplier tables...")
+    """,
 
     # Supplier tables
-    pg.execute("""
-        CREATE TABLE raw.suppliers (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.suppliers (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             contact_name VARCHAR(255),
             email VARCHAR(255),
@@ -657,146 +591,138 @@ def create_expanded_schema(pg):
             country VARCHAR(100),
             rating DECIMAL(2, 1)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.purchase_orders (
-            id INTEGER PRIMARY KEY,
-            supplier_id INTEGER REFERENCES raw.suppliers(id),
+    """
+        CREATE UNLOGGED TABLE raw.purchase_orders (
+            id INTEGER NOT NULL,
+            supplier_id INTEGER,
             order_date TIMESTAMP,
             expected_delivery TIMESTAMP,
             status VARCHAR(50),
             total_amount DECIMAL(10, 2)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.purchase_order_items (
-            id INTEGER PRIMARY KEY,
-            purchase_order_id INTEGER REFERENCES raw.purchase_orders(id),
-            product_id INTEGER REFERENCES raw.products(id),
+    """
+        CREATE UNLOGGED TABLE raw.purchase_order_items (
+            id INTEGER NOT NULL,
+            purchase_order_id INTEGER,
+            product_id INTEGER,
             quantity INTEGER,
             unit_cost DECIMAL(10, 2),
             total DECIMAL(10, 2)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.supplier_payments (
-            id INTEGER PRIMARY KEY,
-            purchase_order_id INTEGER REFERENCES raw.purchase_orders(id),
+    """
+        CREATE UNLOGGED TABLE raw.supplier_payments (
+            id INTEGER NOT NULL,
+            purchase_order_id INTEGER,
             payment_date TIMESTAMP,
             amount DECIMAL(10, 2),
             payment_method VARCHAR(50),
             status VARCHAR(50)
         )
-    """)
-
-    print("  → Creating shipping tables...")
+    """,
 
     # Shipping tables
-    pg.execute("""
-        CREATE TABLE raw.carriers (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.carriers (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             contact_phone VARCHAR(50),
             rating DECIMAL(2, 1)
         )
-    """)
-
-    pg.execute("""
-        CREATE TABLE raw.shipments (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
-            carrier_id INTEGER REFERENCES raw.carriers(id),
-            warehouse_id INTEGER REFERENCES raw.warehouses(id),
+    """,
+
+    """
+        CREATE UNLOGGED TABLE raw.shipments (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
+            carrier_id INTEGER,
+            warehouse_id INTEGER,
             tracking_number VARCHAR(100),
             ship_date TIMESTAMP,
             estimated_delivery TIMESTAMP,
             actual_delivery TIMESTAMP,
             status VARCHAR(50)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.tracking_events (
-            id INTEGER PRIMARY KEY,
-            shipment_id INTEGER REFERENCES raw.shipments(id),
+    """
+        CREATE UNLOGGED TABLE raw.tracking_events (
+            id INTEGER NOT NULL,
+            shipment_id INTEGER,
             event_type VARCHAR(100),
             location VARCHAR(255),
             event_date TIMESTAMP,
             notes TEXT
         )
-    """)
-
-    print("  → Creating returns tables...")
+    """,
 
     # Returns tables
-    pg.execute("""
-        CREATE TABLE raw.returns (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
+    """
+        CREATE UNLOGGED TABLE raw.returns (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
             return_date TIMESTAMP,
             reason VARCHAR(100),
             status VARCHAR(50),
             notes TEXT
         )
-    """)
-
-    pg.execute("""
-        CREATE TABLE raw.return_items (
-            id INTEGER PRIMARY KEY,
-            return_id INTEGER REFERENCES raw.returns(id),
-            order_item_id INTEGER REFERENCES raw.order_items(id),
-            product_id INTEGER REFERENCES raw.products(id),
+    """,
+
+    """
+        CREATE UNLOGGED TABLE raw.return_items (
+            id INTEGER NOT NULL,
+            return_id INTEGER,
+            order_item_id INTEGER,
+            product_id INTEGER,
             quantity INTEGER,
             refund_amount DECIMAL(10, 2)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.refund_transactions (
-            id INTEGER PRIMARY KEY,
-            return_id INTEGER REFERENCES raw.returns(id),
+    """
+        CREATE UNLOGGED TABLE raw.refund_transactions (
+            id INTEGER NOT NULL,
+            return_id INTEGER,
             refund_date TIMESTAMP,
             amount DECIMAL(10, 2),
             method VARCHAR(100),
             status VARCHAR(50)
         )
-    """)
-
-    print("  → Creating payment tables...")
+    """,
 
     # Payment tables
-    pg.execute("""
-        CREATE TABLE raw.payment_methods (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER REFERENCES raw.customers(id),
+    """
+        CREATE UNLOGGED TABLE raw.payment_methods (
+            id INTEGER NOT NULL,
+            customer_id INTEGER,
             type VARCHAR(50),
             last_four VARCHAR(4),
             expiry_date DATE,
             is_default BOOLEAN
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.payment_transactions (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
-            payment_method_id INTEGER REFERENCES raw.payment_methods(id),
+    """
+        CREATE UNLOGGED TABLE raw.payment_transactions (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
+            payment_method_id INTEGER,
             transaction_date TIMESTAMP,
             amount DECIMAL(10, 2),
             status VARCHAR(50),
             transaction_id VARCHAR(100)
         )
-    """)
-
-    print("  → Creating marketing tables...")
+    """,
 
     # Marketing tables
-    pg.execute("""
-        CREATE TABLE raw.campaigns (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.campaigns (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             channel VARCHAR(100),
             start_date DATE,
@@ -804,11 +730,11 @@ def create_expanded_schema(pg):
             budget DECIMAL(10, 2),
             status VARCHAR(50)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.promotions (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.promotions (
+            id INTEGER NOT NULL,
             code VARCHAR(20),
             type VARCHAR(50),
             discount_value DECIMAL(10, 2),
@@ -817,23 +743,21 @@ def create_expanded_schema(pg):
             usage_limit INTEGER,
             times_used INTEGER
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.customer_segments (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER REFERENCES raw.customers(id),
+    """
+        CREATE UNLOGGED TABLE raw.customer_segments (
+            id INTEGER NOT NULL,
+            customer_id INTEGER,
             segment_name VARCHAR(100),
             assigned_date DATE
         )
-    """)
-
-    print("  → Creating employee tables...")
+    """,
 
     # Employee tables
-    pg.execute("""
-        CREATE TABLE raw.employees (
-            id INTEGER PRIMARY KEY,
+    """
+        CREATE UNLOGGED TABLE raw.employees (
+            id INTEGER NOT NULL,
             name VARCHAR(255),
             email VARCHAR(255),
             department VARCHAR(100),
@@ -841,31 +765,186 @@ def create_expanded_schema(pg):
             hire_date DATE,
             salary DECIMAL(10, 2)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.sales_reps (
-            sales_rep_id INTEGER PRIMARY KEY REFERENCES raw.employees(id),
+    """
+        CREATE UNLOGGED TABLE raw.sales_reps (
+            sales_rep_id INTEGER NOT NULL,
             name VARCHAR(255),
             email VARCHAR(255)
         )
-    """)
+    """,
 
-    pg.execute("""
-        CREATE TABLE raw.commissions (
-            id INTEGER PRIMARY KEY,
-            order_id INTEGER REFERENCES raw.orders(id),
-            sales_rep_id INTEGER REFERENCES raw.sales_reps(sales_rep_id),
+    """
+        CREATE UNLOGGED TABLE raw.commissions (
+            id INTEGER NOT NULL,
+            order_id INTEGER,
+            sales_rep_id INTEGER,
             commission_rate DECIMAL(6, 4),
             commission_amount DECIMAL(10, 2),
             paid_date TIMESTAMP,
             status VARCHAR(50)
         )
-    """)
+    """,
+)
+
+# The whole schema rebuild as one script, assembled once at import: create
+# the schema, drop every table in reverse dependency order, create them again
+SCHEMA_SCRIPT = ";\n".join([
+    "CREATE SCHEMA IF NOT EXISTS raw",
+    *(f"DROP TABLE IF EXISTS raw.{table} CASCADE" for table in reversed(TABLES)),
+    *_CREATE_TABLES,
+])
+
+
+def create_expanded_schema(pg):
+    """Create all schemas and tables for expanded dataset"""
+    print("📦 Creating raw schema and all tables...")
+
+    # One round-trip instead of ~50, and psycopg2 runs the script inside the
+    # connection's transaction so a failure part-way leaves the old tables in place
+    print(f"  → Dropping and creating {len(TABLES)} tables...")
+    pg.execute(SCHEMA_SCRIPT)
 
     print("✓ All schemas and tables created")
 
 
+# Post-load constraint script, also assembled once at import. Tables must be
+# LOGGED before a foreign key can point at them, and each index is built once
+# over the loaded rows instead of row by row. Adding a foreign key to a filled
+# table checks its existing rows with a single anti-join against the referenced
+# table rather than one trigger call per row
+CONSTRAINTS_SCRIPT = ";\n".join([
+    *(f"ALTER TABLE raw.{table} SET LOGGED" for table in TABLES),
+    *(f"ALTER TABLE raw.{table} ADD PRIMARY KEY ({pk})" for table, pk in TABLES.items()),
+    "ALTER TABLE raw.customers ADD UNIQUE (email)",
+    *(
+        f"ALTER TABLE raw.{table} ADD FOREIGN KEY ({column}) "
+        f"REFERENCES raw.{ref_table}({ref_column})"
+        for table, column, ref_table, ref_column in FOREIGN_KEYS
+    ),
+])
+
+
+def add_constraints(pg):
+    """Make the loaded tables durable and add their keys and FOREIGN_KEYS"""
+    print("🔑 Adding keys and constraints...")
+    with pg.transaction():
+        # More memory for the index builds and foreign key checks, for this
+        # transaction only
+        pg.execute("SET LOCAL maintenance_work_mem = '1GB'")
+        pg.execute(CONSTRAINTS_SCRIPT)
+    print(f"✓ Keys and {len(FOREIGN_KEYS)} foreign keys added")
+
+
+# ============================================================================
+# PARALLEL GENERATION
+# ============================================================================
+
+def _init_worker():
+    """
+    Give each worker process its own Faker instance rather than a copy of the
+    parent's (forked) or none at all (spawned, e.g. on Windows/macOS)
+    """
+    global fake
+    fake = fake_generators.fake = Faker()
+
+
+def _seeded_call(name, func, *args):
+    """
+    Run a generator in a worker process with Faker and rng reseeded
+    from the table name, so its output doesn't depend on which worker ran it
+    or what that worker generated before
+    """
+    reseed(zlib.crc32(name.encode()) ^ 42)
+    return func(*args)
+
+
+# Every generator as {task: (generator, [tables it reads], *extra args)}.
+# Table inputs are passed first, in the order listed
+GENERATION_TASKS = {
+    'customers': (generate_customers, [], 100),
+    'products': (generate_products, [], 50),
+    'warehouses': (generate_warehouses, [], 5),
+    'suppliers': (generate_suppliers, [], 15),
+    'carriers': (generate_carriers, [], 5),
+    'campaigns': (generate_campaigns, [], 10),
+    'promotions': (generate_promotions, [], 20),
+    'employees': (generate_employees, [], 25),
+    'orders': (generate_orders, ['customers', 'products'], 500),
+    'stock_levels': (generate_stock_levels, ['products', 'warehouses']),
+    'purchase_orders': (generate_purchase_orders, ['suppliers', 'products'], 200),
+    'sales_reps': (generate_sales_reps, ['employees']),
+    'payment_methods': (generate_payment_methods, ['customers']),
+    'customer_segments': (generate_customer_segments, ['customers']),
+    'inventory_adjustments': (generate_inventory_adjustments, ['stock_levels'], 100),
+    'supplier_payments': (generate_supplier_payments, ['purchase_orders'], 150),
+    'shipments': (generate_shipments, ['orders', 'carriers', 'warehouses']),
+    'returns': (generate_returns, ['orders'], 50),
+    'payment_transactions': (generate_payment_transactions, ['orders', 'payment_methods']),
+    'commissions': (generate_commissions, ['orders', 'sales_reps']),
+    'tracking_events': (generate_tracking_events, ['shipments'], 300),
+    'return_items': (generate_return_items, ['returns', 'order_items']),
+    'refund_transactions': (generate_refund_transactions, ['returns', 'return_items']),
+}
+
+# Tasks whose generator returns several tables, and the names they fill
+TASK_OUTPUTS = {
+    'orders': ('orders', 'order_items'),
+    'purchase_orders': ('purchase_orders', 'purchase_order_items'),
+}
+
+
+def _generate_all(pool, tasks):
+    """
+    Run tasks in the pool, submitting each one as soon as every table it
+    reads has been generated, and return {table: DataFrame}
+    """
+    data = {}
+    pending = dict(tasks)
+    running = {}
+
+    def submit_ready():
+        for name, (func, inputs, *args) in list(pending.items()):
+            if all(table in data for table in inputs):
+                del pending[name]
+                tables = [data[table] for table in inputs]
+                running[pool.submit(_seeded_call, name, func, *tables, *args)] = name
+
+    submit_ready()
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            result = future.result()
+            if name in TASK_OUTPUTS:
+                data.update(zip(TASK_OUTPUTS[name], result))
+            else:
+                data[name] = result
+        submit_ready()
+
+    if pending:
+        raise ValueError(f"Tasks with unmet inputs: {sorted(pending)}")
+    return data
+
+
+# ============================================================================
+# PARALLEL LOADING
+# ============================================================================
+
+# Upper bound on concurrent COPY connections
+LOAD_WORKERS = 8
+
+
+def _load_table(table, df):
+    """COPY one generated table into raw.<table> over its own pooled connection"""
+    with PostgresConnector() as pg, pg.transaction():
+        # Throwaway seed data: don't wait for a WAL flush on commit. SET LOCAL
+        # ends with this transaction, so nothing leaks back into the pool
+        pg.execute("SET LOCAL synchronous_commit = off")
+        pg.copy_dataframe(df, f'raw.{table}')
+
+
 # ============================================================================
 # MAIN SEEDING FUNCTION
 # ============================================================================
@@ -876,89 +955,51 @@ def seed_expanded_data():
     print("🌱 SEEDING EXPANDED FAKE DATA - 24 TABLES")
     print("=" * 70 + "\n")
 
-    # Generate core data
-    print("🎲 Generating core data...")
-    customers_df = generate_customers(100)
-    print(f"  ✓ Generated {len(customers_df)} customers")
+    # Generate every table, running independent generators side by side in
+    # worker processes. Each starts as soon as the tables it reads are ready,
+    # so the slowest chain, not the slowest table per stage, bounds the wait
+    print("🎲 Generating data...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as pool:
+        data = _generate_all(pool, GENERATION_TASKS)
+
+    customers_df, products_df = data['customers'], data['products']
+    orders_df, order_items_df = data['orders'], data['order_items']
+    warehouses_df, stock_levels_df = data['warehouses'], data['stock_levels']
+    inventory_adjustments_df = data['inventory_adjustments']
+    suppliers_df, purchase_orders_df = data['suppliers'], data['purchase_orders']
+    po_items_df, supplier_payments_df = data['purchase_order_items'], data['supplier_payments']
+    carriers_df, shipments_df = data['carriers'], data['shipments']
+    tracking_events_df = data['tracking_events']
+    returns_df, return_items_df = data['returns'], data['return_items']
+    refund_transactions_df = data['refund_transactions']
+    payment_methods_df, payment_transactions_df = data['payment_methods'], data['payment_transactions']
+    campaigns_df, promotions_df = data['campaigns'], data['promotions']
+    customer_segments_df = data['customer_segments']
+    employees_df, sales_reps_df = data['employees'], data['sales_reps']
+    commissions_df = data['commissions']
 
-    products_df = generate_products(50)
+    print(f"  ✓ Generated {len(customers_df)} customers")
     print(f"  ✓ Generated {len(products_df)} products")
-
-    orders_df, order_items_df = generate_orders(customers_df, products_df, 500)
     print(f"  ✓ Generated {len(orders_df)} orders with {len(order_items_df)} items")
-
-    # Generate inventory data
-    print("\n📦 Generating inventory data...")
-    warehouses_df = generate_warehouses(5)
     print(f"  ✓ Generated {len(warehouses_df)} warehouses")
-
-    stock_levels_df = generate_stock_levels(products_df, warehouses_df)
     print(f"  ✓ Generated {len(stock_levels_df)} stock level records")
-
-    inventory_adjustments_df = generate_inventory_adjustments(stock_levels_df, 100)
     print(f"  ✓ Generated {len(inventory_adjustments_df)} inventory adjustments")
-
-    # Generate supplier data
-    print("\n🏭 Generating supplier data...")
-    suppliers_df = generate_suppliers(15)
     print(f"  ✓ Generated {len(suppliers_df)} suppliers")
-
-    purchase_orders_df, po_items_df = generate_purchase_orders(suppliers_df, products_df, 200)
     print(f"  ✓ Generated {len(purchase_orders_df)} purchase orders with {len(po_items_df)} items")
-
-    supplier_payments_df = generate_supplier_payments(purchase_orders_df, 150)
     print(f"  ✓ Generated {len(supplier_payments_df)} supplier payments")
-
-    # Generate shipping data
-    print("\n🚚 Generating shipping data...")
-    carriers_df = generate_carriers(5)
     print(f"  ✓ Generated {len(carriers_df)} carriers")
-
-    shipments_df = generate_shipments(orders_df, carriers_df, warehouses_df)
     print(f"  ✓ Generated {len(shipments_df)} shipments")
-
-    tracking_events_df = generate_tracking_events(shipments_df, 300)
     print(f"  ✓ Generated {len(tracking_events_df)} tracking events")
-
-    # Generate returns data
-    print("\n↩️  Generating returns data...")
-    returns_df = generate_returns(orders_df, 50)
     print(f"  ✓ Generated {len(returns_df)} returns")
-
-    return_items_df = generate_return_items(returns_df, order_items_df)
     print(f"  ✓ Generated {len(return_items_df)} return items")
-
-    refund_transactions_df = generate_refund_transactions(returns_df, return_items_df)
     print(f"  ✓ Generated {len(refund_transactions_df)} refund transactions")
-
-    # Generate payment data
-    print("\n💳 Generating payment data...")
-    payment_methods_df = generate_payment_methods(customers_df)
     print(f"  ✓ Generated {len(payment_methods_df)} payment methods")
-
-    payment_transactions_df = generate_payment_transactions(orders_df, payment_methods_df)
     print(f"  ✓ Generated {len(payment_transactions_df)} payment transactions")
-
-    # Generate marketing data
-    print("\n📢 Generating marketing data...")
-    campaigns_df = generate_campaigns(10)
     print(f"  ✓ Generated {len(campaigns_df)} campaigns")
-
-    promotions_df = generate_promotions(20)
     print(f"  ✓ Generated {len(promotions_df)} promotions")
-
-    customer_segments_df = generate_customer_segments(customers_df)
     print(f"  ✓ Generated {len(customer_segments_df)} customer segment assignments")
-
-    # Generate employee data
-    print("\n👥 Generating employee data...")
-    employees_df = generate_employees(25)
     print(f"  ✓ Generated {len(employees_df)} employees")
-
-    sales_reps_df = generate_sales_reps(employees_df)
     print(f"  ✓ Generated {len(sales_reps_df)} sales reps")
-
-    commissions_df = generate_commissions(orders_df, sales_reps_df)
     print(f"  ✓ Generated {len(commissions_df)} commission records")
 
     # Connect to database
@@ -967,49 +1008,16 @@ def seed_expanded_data():
         # Create schema and tables
         create_expanded_schema(pg)
 
-        # Insert data in dependency order
+        # Tables load side by side over pooled connections, each in its own
+        # transaction; no load order is needed since keys and foreign keys
+        # are only added, and checked in bulk, once every table is in
         print("\n💾 Loading data into PostgreSQL...")
+        workers = min(LOAD_WORKERS, os.cpu_count())
+        print(f"  → Inserting {len(data)} tables over {workers} connections...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_load_table, data.keys(), data.values()))
 
-        print("  → Inserting core data...")
-        pg.insert_dataframe(customers_df, 'raw.customers')
-        pg.insert_dataframe(products_df, 'raw.products')
-        pg.insert_dataframe(orders_df, 'raw.orders')
-        pg.insert_dataframe(order_items_df, 'raw.order_items')
-
-        print("  → Inserting inventory data...")
-        pg.insert_dataframe(warehouses_df, 'raw.warehouses')
-        pg.insert_dataframe(stock_levels_df, 'raw.stock_levels')
-        pg.insert_dataframe(inventory_adjustments_df, 'raw.inventory_adjustments')
-
-        print("  → Inserting supplier data...")
-        pg.insert_dataframe(suppliers_df, 'raw.suppliers')
-        pg.insert_dataframe(purchase_orders_df, 'raw.purchase_orders')
-        pg.insert_dataframe(po_items_df, 'raw.purchase_order_items')
-        pg.insert_dataframe(supplier_payments_df, 'raw.supplier_payments')
-
-        print("  → Inserting shipping data...")
-        pg.insert_dataframe(carriers_df, 'raw.carriers')
-        pg.insert_dataframe(shipments_df, 'raw.shipments')
-        pg.insert_dataframe(tracking_events_df, 'raw.tracking_events')
-
-        print("  → Inserting returns data...")
-        pg.insert_dataframe(returns_df, 'raw.returns')
-        pg.insert_dataframe(return_items_df, 'raw.return_items')
-        pg.insert_dataframe(refund_transactions_df, 'raw.refund_transactions')
-
-        print("  → Inserting payment data...")
-        pg.insert_dataframe(payment_methods_df, 'raw.payment_methods')
-        pg.insert_dataframe(payment_transactions_df, 'raw.payment_transactions')
-
-        print("  → Inserting marketing data...")
-        pg.insert_dataframe(campaigns_df, 'raw.campaigns')
-        pg.insert_dataframe(promotions_df, 'raw.promotions')
-        pg.insert_dataframe(customer_segments_df, 'raw.customer_segments')
-
-        print("  → Inserting employee data...")
-        pg.insert_dataframe(employees_df, 'raw.employees')
-        pg.insert_dataframe(sales_reps_df, 'raw.sales_reps')
-        pg.insert_dataframe(commissions_df, 'raw.commissions')
+        add_constraints(pg)
 
         print("\n✅ Data loading complete!")
 
@@ -1018,24 +1026,15 @@ def seed_expanded_data():
         print("📊 DATA SUMMARY - 24 TABLES")
         print("=" * 70)
 
-        tables = [
-            'customers', 'products', 'orders', 'order_items',
-            'warehouses', 'stock_levels', 'inventory_adjustments',
-            'suppliers', 'purchase_orders', 'purchase_order_items', 'supplier_payments',
-            'carriers', 'shipments', 'tracking_events',
-            'returns', 'return_items', 'refund_transactions',
-            'payment_methods', 'payment_transactions',
-            'campaigns', 'promotions', 'customer_segments',
-            'employees', 'sales_reps', 'commissions'
-        ]
-
-        for i in range(0, len(tables), 3):
-            batch = tables[i:i+3]
-            counts = []
-            for table in batch:
-                result = pg.query_to_dataframe(f"SELECT COUNT(*) as count FROM raw.{table}")
-                counts.append(f"{table}: {result['count'][0]}")
-            print(f"  {' | '.join(counts)}")
+        # Every count in one query, so the summary costs one round-trip
+        # instead of one per table
+        result = pg.query_to_dataframe(" UNION ALL ".join(
+            f"SELECT '{table}' AS table_name, COUNT(*) AS count FROM raw.{table}"
+            for table in TABLES
+        ))
+        counts = [f"{table}: {count}" for table, count in zip(result['table_name'], result['count'])]
+        for i in range(0, len(counts), 3):
+            print(f"  {' | '.join(counts[i:i+3])}")
 
         print("=" * 70 + "\n")
 
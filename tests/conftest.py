@@ -0,0 +1,20 @@
+"""Shared pytest setup: make the top-level modules importable from tests/"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def pg_available():
+    """Skip the test unless the configured PostgreSQL server is reachable"""
+    import psycopg2
+    from postgres import PostgresConnector
+
+    try:
+        with PostgresConnector() as pg:
+            pg.execute("SELECT 1")
+    except (psycopg2.OperationalError, ConnectionError) as e:
+        pytest.skip(f"PostgreSQL not available: {e}")
@@ -0,0 +1,66 @@
+"""BaseTrainer must fit models that predict on the DataFrames the predictor passes"""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from ml.training.base_trainer import BaseTrainer
+
+
+class _LogisticTrainer(BaseTrainer):
+    def build_model(self, **kwargs):
+        return LogisticRegression()
+
+    def preprocess_features(self, df):
+        return df
+
+
+@pytest.fixture
+def trained():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'age': rng.uniform(18, 80, 200),
+        'spend': rng.uniform(0, 1000, 200),
+        'churned': rng.integers(0, 2, 200)
+    })
+    trainer = _LogisticTrainer('churn_test', 'classification')
+    X_train, X_test, y_train, _ = trainer.split_data(df, 'churned')
+    trainer.train(X_train, y_train)
+    return trainer, X_test
+
+
+def test_fit_keeps_feature_names(trained):
+    trainer, X_test = trained
+    assert list(trainer.model.feature_names_in_) == ['age', 'spend']
+
+    # What ModelPredictor passes: a float64 DataFrame in feature_columns order
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        trainer.model.predict(X_test[trainer.feature_columns])
+
+
+def test_predict_rejects_reordered_columns(trained):
+    trainer, X_test = trained
+    with pytest.raises(ValueError):
+        trainer.model.predict(X_test[['spend', 'age']])
+
+
+class _RecordingConnector:
+    def __init__(self):
+        self.calls = []
+
+    def query_to_dataframe(self, query, params=None, chunksize=None):
+        self.calls.append(chunksize)
+        return pd.DataFrame({'x': [1.0]})
+
+
+def test_load_data_streams_only_when_chunksize_given():
+    trainer = _LogisticTrainer('churn_test', 'classification')
+    pg = _RecordingConnector()
+
+    trainer.load_data(query="SELECT 1 AS x", pg=pg)
+    trainer.load_data(query="SELECT 1 AS x", pg=pg, chunksize=10_000)
+
+    assert pg.calls == [None, 10_000]
@@ -0,0 +1,31 @@
+import os
+
+from transformations.model_loader import ModelLoader
+
+
+def test_cached_load_reparses_only_when_model_files_change(tmp_path):
+    bronze = tmp_path / "bronze"
+    bronze.mkdir()
+    (bronze / "stg_a.sql").write_text("select 1 as id")
+
+    loader = ModelLoader(models_dir=str(tmp_path))
+    first = loader.load_all_models(cached=True)
+    parsed = loader._models_cache[1]
+
+    # Unchanged directory: same parse, but callers get their own copies
+    second = loader.load_all_models(cached=True)
+    assert loader._models_cache[1] is parsed
+    assert [m.name for m in second] == ["stg_a"]
+    second[0].status = "failed"
+    assert first[0].status == "pending"
+    assert parsed[0].status == "pending"
+
+    # Added and modified files invalidate the cache
+    (bronze / "stg_b.sql").write_text("select 2 as id")
+    stat = (bronze / "stg_a.sql").stat()
+    (bronze / "stg_a.sql").write_text("select 3 as id")
+    os.utime(bronze / "stg_a.sql", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = loader.load_all_models(cached=True)
+    assert sorted(m.name for m in third) == ["stg_a", "stg_b"]
+    assert "select 3" in next(m for m in third if m.name == "stg_a").sql_query
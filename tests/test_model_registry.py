@@ -0,0 +1,64 @@
+"""ModelRegistry in-memory state must match what a reload replays from disk"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ml.registry.model_registry import ModelRegistry
+
+
+def _register(registry, version, accuracy):
+    registry.register_model(
+        {'weights': [1, 2, 3]}, 'churn', 'classification',
+        version=version, metrics={'accuracy': accuracy}
+    )
+
+
+@pytest.mark.parametrize('compact_threshold', [100, 2])
+def test_reregistered_version_round_trips(tmp_path, compact_threshold):
+    registry = ModelRegistry(str(tmp_path), compact_threshold=compact_threshold)
+    _register(registry, 'v1', 0.7)
+    _register(registry, 'v3', 0.8)
+    _register(registry, 'v3', 0.9)
+
+    versions = [m['version'] for m in registry.list_model_versions('churn')]
+    assert sorted(versions) == ['v1', 'v3']
+    assert registry.get_model_metadata('churn', 'v3')['metrics'] == {'accuracy': 0.9}
+
+    reloaded = ModelRegistry(str(tmp_path), compact_threshold=compact_threshold)
+    assert reloaded.metadata == registry.metadata
+    assert reloaded.get_model_metadata('churn')['version'] == 'v3'
+    assert reloaded.list_models() == registry.list_models()
+
+
+def test_importing_ml_modules_does_not_create_the_registry(tmp_path):
+    # Run in a fresh interpreter from an empty directory: creating the registry
+    # would make ml/models there and leave the instance in the module globals
+    repo_root = Path(__file__).resolve().parent.parent
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(repo_root)!r})\n"
+        "import ml, ml.registry, ml.inference.predictor, ml.jinja_functions\n"
+        "module = sys.modules['ml.registry.model_registry']\n"
+        "assert 'model_registry' not in vars(module)\n"
+        "assert ml.model_registry is module.model_registry\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, check=True)
+    assert (tmp_path / "ml" / "models").is_dir()
+
+
+def test_returned_metadata_omits_internal_sequence(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    _register(registry, 'v1', 0.7)
+    _register(registry, 'v2', 0.8)
+
+    assert '_seq' not in registry.get_model_metadata('churn')
+    assert '_seq' not in registry.get_model_metadata('churn', 'v1')
+    versions = registry.list_model_versions('churn')
+    assert [m['version'] for m in versions] == ['v2', 'v1']
+    assert all('_seq' not in m for m in versions)
+
+    # Callers get copies, so editing one can't corrupt the registry's ordering
+    registry.get_model_metadata('churn')['version'] = 'edited'
+    assert registry.get_model_metadata('churn')['version'] == 'v2'
@@ -0,0 +1,58 @@
+"""PostgresConnector.execute_values batching, RETURNING and transactions"""
+import pytest
+
+from postgres import PostgresConnector
+
+
+@pytest.fixture
+def pg(pg_available):
+    with PostgresConnector() as pg:
+        pg.execute("CREATE TEMP TABLE ev_test (id serial PRIMARY KEY, name text, score float8)")
+        try:
+            yield pg
+        finally:
+            # Temp tables live as long as the pooled session, not the checkout
+            pg.execute("DROP TABLE ev_test")
+
+
+def test_fetch_returns_rows_from_every_page(pg):
+    names = [f"m{i}" for i in range(5)]
+    with pg.transaction():
+        rows = pg.execute_values(
+            "INSERT INTO ev_test (name) VALUES %s RETURNING id, name",
+            [(name,) for name in names], page_size=2, fetch=True
+        )
+
+    assert sorted(name for _, name in rows) == names
+    assert pg.execute("SELECT count(*) AS n FROM ev_test", fetch=True)[0]['n'] == 5
+
+
+def test_template_and_rollback_inside_transaction(pg):
+    pg.execute_values("INSERT INTO ev_test (name) VALUES %s", [("a",), ("b",)])
+
+    with pytest.raises(RuntimeError):
+        with pg.transaction():
+            pg.execute_values("""
+                UPDATE ev_test SET score = v.score
+                FROM (VALUES %s) AS v (name, score)
+                WHERE ev_test.name = v.name
+            """, [("a", "1.5"), ("b", "2")], template="(%s::text, %s::float8)")
+            raise RuntimeError("boom")
+
+    scores = pg.execute("SELECT score FROM ev_test ORDER BY name", fetch=True)
+    assert [r['score'] for r in scores] == [None, None]
+
+    with pg.transaction():
+        pg.execute_values("""
+            UPDATE ev_test SET score = v.score
+            FROM (VALUES %s) AS v (name, score)
+            WHERE ev_test.name = v.name
+        """, [("a", "1.5"), ("b", "2")], template="(%s::text, %s::float8)")
+
+    scores = pg.execute("SELECT score FROM ev_test ORDER BY name", fetch=True)
+    assert [r['score'] for r in scores] == [1.5, 2.0]
+
+
+def test_empty_rows_is_a_no_op(pg):
+    assert pg.execute_values("INSERT INTO ev_test (name) VALUES %s", [], fetch=True) == []
+    assert pg.execute_values("INSERT INTO ev_test (name) VALUES %s", []) is None
@@ -0,0 +1,39 @@
+"""Pooled PostgresConnector connections must not leak session state"""
+from psycopg2 import sql
+
+from postgres import PostgresConnector
+
+
+def _backend_and_search_path(pg):
+    row = pg.execute(
+        "SELECT pg_backend_pid() AS pid, current_setting('search_path') AS search_path",
+        fetch=True
+    )[0]
+    return row['pid'], row['search_path']
+
+
+def test_session_settings_do_not_carry_over_to_next_checkout(pg_available):
+    with PostgresConnector() as pg:
+        _, default_path = _backend_and_search_path(pg)
+        pg.execute(sql.SQL("SET search_path TO {}, public").format(sql.Identifier('raw')))
+        pid, changed_path = _backend_and_search_path(pg)
+        assert changed_path != default_path
+
+    # The pool hands the same physical connection straight back out
+    with PostgresConnector() as pg:
+        next_pid, next_path = _backend_and_search_path(pg)
+
+    assert next_pid == pid
+    assert next_path == default_path
+
+
+def test_nested_with_reuses_one_connection(pg_available):
+    pg = PostgresConnector()
+    with pg:
+        conn = pg.conn
+        with pg:
+            assert pg.conn is conn
+        # Only the outermost exit hands the connection back
+        assert pg.conn is conn
+        pg.execute("SELECT 1")
+    assert pg.conn is None
@@ -10,6 +10,7 @@ class DAG:
         self.models = {model.name: model for model in models}
         self.graph = self._build_graph()
         self._validate()
+        self._execution_order = None
 
     def _build_graph(self) -> Dict[str, List[str]]:
         """Build adjacency list representation of the DAG"""
@@ -48,8 +49,15 @@ class DAG:
     def get_execution_order(self) -> List[str]:
         """
         Return topologically sorted list of model names
-        (models with no dependencies come first)
+        (models with no dependencies come first).
+        Sorted once per DAG; later calls return a copy of the cached order.
         """
+        if self._execution_order is None:
+            self._execution_order = self._topological_sort()
+        return list(self._execution_order)
+
+    def _topological_sort(self) -> List[str]:
+        """Kahn's algorithm over the dependency graph"""
         in_degree = defaultdict(int)
 
         # Calculate in-degrees
@@ -4,10 +4,12 @@ Loads SQL models from files with Jinja templating support
 """
 import os
 import ast
+import copy
 import yaml
 import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader, Template
 from psycopg2 import sql as psycopg2_sql
 
@@ -53,6 +55,9 @@ class ModelLoader:
         self.sources_file = sources_file or self.models_dir / "sources.yml"
         self.sources = {}
         self.models = {}
+        # (models dir fingerprint, parsed models) for load_all_models(cached=True)
+        self._models_cache: Optional[Tuple[tuple, List[TransformationModel]]] = None
+        self._models_lock = threading.Lock()
 
         # Load sources configuration
         if self.sources_file and Path(self.sources_file).exists():
@@ -72,6 +77,12 @@ class ModelLoader:
                     'tables': {table['name']: table for table in source.get('tables', [])}
                 }
 
+    def reload_sources(self):
+        """Re-read sources.yml, dropping sources that were removed from it"""
+        self.sources = {}
+        if self.sources_file and Path(self.sources_file).exists():
+            self._load_sources()
+
     def source(self, source_name: str, table_name: str) -> str:
         """
         DBT source() macro implementation
@@ -415,9 +426,34 @@ class ModelLoader:
 
         return result_df
 
-    def load_all_models(self) -> List[TransformationModel]:
-        """Load all models from bronze, silver, and gold layers"""
-        return self.load_models_from_directory()
+    def _models_dir_signature(self) -> tuple:
+        """Fingerprint model files by path and mtime so edits, adds and deletes invalidate"""
+        return tuple(sorted(
+            (str(path), path.stat().st_mtime_ns)
+            for pattern in ('*.sql', '*.py', '*.yml')
+            for path in self.models_dir.rglob(pattern)
+        ))
+
+    def load_all_models(self, cached: bool = False) -> List[TransformationModel]:
+        """
+        Load all models from bronze, silver, and gold layers
+
+        Args:
+            cached: Re-parse the models directory only when a model file was
+                added, removed or modified. Returns copies so callers don't
+                share per-run state (status, result, error).
+        """
+        if not cached:
+            return self.load_models_from_directory()
+
+        signature = self._models_dir_signature()
+        with self._models_lock:
+            if self._models_cache is None or self._models_cache[0] != signature:
+                # sources.yml is part of the signature, so pick up its changes too
+                self.reload_sources()
+                self._models_cache = (signature, self.load_models_from_directory())
+            models = self._models_cache[1]
+        return [copy.copy(model) for model in models]
 
 
 # Example usage
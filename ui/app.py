@@ -116,7 +116,19 @@ def require_queries_execute():
     """Require permission to execute SQL queries"""
     return require_permission('queries', 'execute')
 
-app = FastAPI(title="TransformDash", description="Hybrid Data Transformation Platform")
+# Serialize API responses with orjson when it's installed (much faster on
+# large model/run payloads); fall back to the stdlib-based JSONResponse
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+app = FastAPI(
+    title="TransformDash",
+    description="Hybrid Data Transformation Platform",
+    default_response_class=DefaultResponse
+)
 
 # Add rate limiting middleware
 app.add_middleware(RateLimitMiddleware)
@@ -1416,11 +1428,11 @@ async def update_dashboard(dashboard_id: str, request: Request):
                 pg.execute("DELETE FROM dashboard_filters WHERE dashboard_id = %s", (dashboard_id,))
 
                 # Insert new filters
-                for filter_idx, filter_def in enumerate(new_filters):
-                    pg.execute("""
-                        INSERT INTO dashboard_filters (dashboard_id, field, label, model, expression, apply_to_tabs, position)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """, (
+                pg.execute_values("""
+                    INSERT INTO dashboard_filters (dashboard_id, field, label, model, expression, apply_to_tabs, position)
+                    VALUES %s
+                """, [
+                    (
                         dashboard_id,
                         filter_def.get('field'),
                         filter_def.get('label'),
@@ -1428,7 +1440,9 @@ async def update_dashboard(dashboard_id: str, request: Request):
                         filter_def.get('expression'),
                         filter_def.get('apply_to_tabs', []),
                         filter_idx
-                    ))
+                    )
+                    for filter_idx, filter_def in enumerate(new_filters)
+                ])
 
             logging.info(f"Successfully updated dashboard {dashboard_id}")
 
@@ -3419,11 +3433,10 @@ async def create_schedule(schedule: ScheduleCreate):
             schedule_id = schedule_record['id']
 
             # Add models to schedule_models table
-            for idx, model_name in enumerate(schedule.model_names):
-                pg.execute("""
-                    INSERT INTO schedule_models (schedule_id, model_name, execution_order)
-                    VALUES (%s, %s, %s)
-                """, params=(schedule_id, model_name, idx))
+            pg.execute_values("""
+                INSERT INTO schedule_models (schedule_id, model_name, execution_order)
+                VALUES %s
+            """, [(schedule_id, model_name, idx) for idx, model_name in enumerate(schedule.model_names)])
 
         # Add to scheduler
         scheduler = get_scheduler()
@@ -3574,11 +3587,10 @@ async def update_schedule(schedule_id: int, update: ScheduleUpdate):
                 """, params=(schedule_id,))
 
                 # Insert new model associations
-                for model_name in update.model_names:
-                    pg.execute("""
-                        INSERT INTO schedule_models (schedule_id, model_name)
-                        VALUES (%s, %s)
-                    """, params=(schedule_id, model_name))
+                pg.execute_values("""
+                    INSERT INTO schedule_models (schedule_id, model_name)
+                    VALUES %s
+                """, [(schedule_id, model_name) for model_name in update.model_names])
 
             # Get updated models for the schedule
             models = pg.execute("""
@@ -4103,11 +4115,10 @@ async def create_user(
             """, (username, email, password_hash, full_name), fetch=True)[0]['id']
 
             # Assign roles
-            for role_id in role_ids:
-                pg.execute("""
-                    INSERT INTO user_roles (user_id, role_id)
-                    VALUES (%s, %s)
-                """, (user_id, role_id))
+            pg.execute_values("""
+                INSERT INTO user_roles (user_id, role_id)
+                VALUES %s
+            """, [(user_id, role_id) for role_id in role_ids])
 
             return {"message": "User created successfully", "user_id": user_id}
 
@@ -4179,11 +4190,10 @@ async def update_user(
                 pg.execute("DELETE FROM user_roles WHERE user_id = %s", (user_id,))
 
                 # Add new roles
-                for role_id in role_ids:
-                    pg.execute("""
-                        INSERT INTO user_roles (user_id, role_id)
-                        VALUES (%s, %s)
-                    """, (user_id, role_id))
+                pg.execute_values("""
+                    INSERT INTO user_roles (user_id, role_id)
+                    VALUES %s
+                """, [(user_id, role_id) for role_id in role_ids])
 
             return {"message": "User updated successfully"}
 
@@ -4297,11 +4307,10 @@ async def create_role(request: Request):
             """, (name, description), fetch=True)[0]['id']
 
             # Assign permissions
-            for permission_id in permission_ids:
-                pg.execute("""
-                    INSERT INTO role_permissions (role_id, permission_id)
-                    VALUES (%s, %s)
-                """, (role_id, permission_id))
+            pg.execute_values("""
+                INSERT INTO role_permissions (role_id, permission_id)
+                VALUES %s
+            """, [(role_id, permission_id) for permission_id in permission_ids])
 
             return {"message": "Role created successfully", "role_id": role_id}
 
@@ -4349,11 +4358,10 @@ async def update_role(role_id: int, request: Request):
                 pg.execute("DELETE FROM role_permissions WHERE role_id = %s", (role_id,))
 
                 # Add new permissions
-                for permission_id in permission_ids:
-                    pg.execute("""
-                        INSERT INTO role_permissions (role_id, permission_id)
-                        VALUES (%s, %s)
-                    """, (role_id, permission_id))
+                pg.execute_values("""
+                    INSERT INTO role_permissions (role_id, permission_id)
+                    VALUES %s
+                """, [(role_id, permission_id) for permission_id in permission_ids])
 
             return {"message": "Role updated successfully"}
 